@@ -20,6 +20,7 @@ from app.models import (
     LoginResponse,
     InviteTokenResponse,
     GuestRegistration,
+    BulkUnregistration,
     TeamComposition,
     TeamScores
 )
@@ -169,6 +170,45 @@ def get_invitations_collection():
     return get_db()[INVITATIONS_COLLECTION]
 
 
+def _slot_with_room_filter(target_date: datetime) -> dict:
+    """Match the slot only while players + guests is below MAX_PLAYERS (atomic capacity guard)"""
+    return {
+        "date": target_date,
+        "$expr": {"$lt": [
+            {"$add": [{"$size": {"$ifNull": ["$players", []]}}, {"$size": {"$ifNull": ["$guests", []]}}]},
+            MAX_PLAYERS
+        ]}
+    }
+
+
+def _parse_guest_label(label: str) -> Optional[str]:
+    """Extract the guest name from "(Invité) Name [par username]", or None if not a guest label"""
+    if not label.startswith("(Invité) "):
+        return None
+    return label[len("(Invité) "):].split(" [par ")[0]
+
+
+def _build_slot_response(slot_doc) -> SlotResponse:
+    """Format a slot document for the frontend"""
+    total_registered = len(slot_doc.get("players", [])) + len(slot_doc.get("guests", []))
+    
+    players_list = [p["username"] for p in slot_doc.get("players", [])]
+    guests_list = [f"(Invité) {g['name']} [par {g['invitedBy']}]" for g in slot_doc.get("guests", [])]
+    
+    player_timestamps = [p.get("registeredAt", slot_doc["date"]).isoformat() if isinstance(p.get("registeredAt"), datetime) else p.get("registeredAt", slot_doc["date"].isoformat()) for p in slot_doc.get("players", [])]
+    guest_timestamps = [g.get("registeredAt", slot_doc["date"]).isoformat() if isinstance(g.get("registeredAt"), datetime) else g.get("registeredAt", slot_doc["date"].isoformat()) for g in slot_doc.get("guests", [])]
+    all_timestamps = player_timestamps + guest_timestamps
+    
+    return SlotResponse(
+        date=slot_doc["date"].isoformat(),
+        players=players_list + guests_list,
+        player_count=total_registered,
+        max_players=MAX_PLAYERS,
+        timestamps=all_timestamps,
+        version=slot_doc.get("version", 0)
+    )
+
+
 # =============================================================================
 # FRONTEND ROUTES
 # =============================================================================
@@ -215,7 +255,8 @@ async def get_current_slot(test_registration_open: Optional[bool] = None):
             "teamA": [],
             "teamB": [],
             "teamAScore": None,
-            "teamBScore": None
+            "teamBScore": None,
+            "version": 0
         }
         await collection.insert_one(new_slot)
         slot_doc = new_slot
@@ -270,10 +311,32 @@ async def get_current_slot(test_registration_open: Optional[bool] = None):
         teamB=teamB_details,
         teamAScore=slot_doc.get("teamAScore"),
         teamBScore=slot_doc.get("teamBScore"),
-        isRegistrationOpen=registration_open
+        isRegistrationOpen=registration_open,
+        version=slot_doc.get("version", 0)
     )
 
 
+@app.get("/api/current-slot/count")
+async def get_current_slot_count():
+    """Return only the number of registered players/guests for the current slot"""
+    collection = get_collection()
+    target_date = get_next_wednesday_at_19()
+    
+    # Let MongoDB compute the array sizes so the player/guest lists are never transferred
+    result = await collection.aggregate([
+        {"$match": {"date": target_date}},
+        {"$project": {"_id": 0, "player_count": {"$add": [
+            {"$size": {"$ifNull": ["$players", []]}},
+            {"$size": {"$ifNull": ["$guests", []]}}
+        ]}}}
+    ]).to_list(length=1)
+    
+    return {
+        "player_count": result[0]["player_count"] if result else 0,
+        "max_players": MAX_PLAYERS
+    }
+
+
 @app.post("/api/register", response_model=SlotResponse)
 async def register_player(registration: PlayerRegistration, username: str, test_registration_open: Optional[bool] = None):
     """Register authenticated user to the current slot"""
@@ -313,15 +376,19 @@ async def register_player(registration: PlayerRegistration, username: str, test_
         raise HTTPException(status_code=400, detail="Vous êtes déjà inscrit")
     
     # Register user with reference (store user_id and username)
-    await collection.update_one(
-        {"date": target_date},
-        {"$push": {"players": {
+    # The filter re-checks capacity so concurrent registrations cannot overfill the slot
+    result = await collection.update_one(
+        _slot_with_room_filter(target_date),
+        {"$inc": {"version": 1}, "$push": {"players": {
             "user_id": str(user["_id"]),
             "username": username,
             "registeredAt": datetime.now()
         }}}
     )
     
+    if result.modified_count == 0:
+        raise HTTPException(status_code=400, detail="Le créneau est complet")
+    
     updated_slot = await collection.find_one({"date": target_date})
     total_registered = len(updated_slot.get("players", [])) + len(updated_slot.get("guests", []))
     
@@ -343,7 +410,8 @@ async def register_player(registration: PlayerRegistration, username: str, test_
         teamB=[],
         teamAScore=updated_slot.get("teamAScore"),
         teamBScore=updated_slot.get("teamBScore"),
-        isRegistrationOpen=is_registration_open()
+        isRegistrationOpen=is_registration_open(),
+        version=updated_slot.get("version", 0)
     )
 
 
@@ -390,9 +458,10 @@ async def register_guest(guest: GuestRegistration, username: str, test_registrat
     guest_id = f"guest_{hashlib.md5(guest_str.encode()).hexdigest()[:8]}"
     
     # Add guest with invitator reference
-    await collection.update_one(
-        {"date": target_date},
-        {"$push": {"guests": {
+    # The filter re-checks capacity so concurrent registrations cannot overfill the slot
+    result = await collection.update_one(
+        _slot_with_room_filter(target_date),
+        {"$inc": {"version": 1}, "$push": {"guests": {
             "guest_id": guest_id,
             "name": guest.guestName,
             "invitedBy_id": str(user["_id"]),
@@ -401,6 +470,9 @@ async def register_guest(guest: GuestRegistration, username: str, test_registrat
         }}}
     )
     
+    if result.modified_count == 0:
+        raise HTTPException(status_code=400, detail="Le créneau est complet")
+    
     updated_slot = await collection.find_one({"date": target_date})
     total_registered = len(updated_slot.get("players", [])) + len(updated_slot.get("guests", []))
     
@@ -422,7 +494,8 @@ async def register_guest(guest: GuestRegistration, username: str, test_registrat
         teamB=[],
         teamAScore=updated_slot.get("teamAScore"),
         teamBScore=updated_slot.get("teamBScore"),
-        isRegistrationOpen=is_registration_open()
+        isRegistrationOpen=is_registration_open(),
+        version=updated_slot.get("version", 0)
     )
 
 
@@ -450,7 +523,7 @@ async def unregister_player(player_name: str, username: str):
             if is_admin or player["user_id"] == str(user["_id"]):
                 await collection.update_one(
                     {"date": target_date},
-                    {"$pull": {"players": {"username": player_name}}}
+                    {"$inc": {"version": 1}, "$pull": {"players": {"username": player_name}}}
                 )
                 player_found = True
                 break
@@ -459,10 +532,8 @@ async def unregister_player(player_name: str, username: str):
     
     # Try to remove from guests array if not found in players
     if not player_found and player_name.startswith("(Invité)"):
-        # Extract guest name from format "(Invité) Name [par username]"
-        try:
-            guest_name = player_name.split("(Invité) ")[1].split(" [par ")[0]
-        except IndexError:
+        guest_name = _parse_guest_label(player_name)
+        if guest_name is None:
             raise HTTPException(status_code=404, detail="Format de nom d'invité invalide")
         
         for guest in slot.get("guests", []):
@@ -470,7 +541,7 @@ async def unregister_player(player_name: str, username: str):
                 if is_admin or guest.get("invitedBy_id") == str(user["_id"]):
                     await collection.update_one(
                         {"date": target_date},
-                        {"$pull": {"guests": {"name": guest_name}}}
+                        {"$inc": {"version": 1}, "$pull": {"guests": {"name": guest_name}}}
                     )
                     player_found = True
                     break
@@ -481,23 +552,57 @@ async def unregister_player(player_name: str, username: str):
         raise HTTPException(status_code=404, detail="Joueur non trouvé")
     
     updated_slot = await collection.find_one({"date": target_date})
-    total_registered = len(updated_slot.get("players", [])) + len(updated_slot.get("guests", []))
+    return _build_slot_response(updated_slot)
+
+
+@app.post("/api/unregister-bulk", response_model=SlotResponse)
+async def unregister_players_bulk(bulk: BulkUnregistration, username: str):
+    """Remove several players and/or guests from the current slot in a single update"""
+    users = get_users_collection()
+    user = await users.find_one({"username": username})
+    if not user:
+        raise HTTPException(status_code=403, detail="Authentification requise")
     
-    # Format response for frontend
-    players_list = [p["username"] for p in updated_slot.get("players", [])]
-    guests_list = [f"(Invité) {g['name']} [par {g['invitedBy']}]" for g in updated_slot.get("guests", [])]
+    collection = get_collection()
+    target_date = get_next_wednesday_at_19()
     
-    player_timestamps = [p.get("registeredAt", updated_slot["date"]).isoformat() if isinstance(p.get("registeredAt"), datetime) else p.get("registeredAt", updated_slot["date"].isoformat()) for p in updated_slot.get("players", [])]
-    guest_timestamps = [g.get("registeredAt", updated_slot["date"]).isoformat() if isinstance(g.get("registeredAt"), datetime) else g.get("registeredAt", updated_slot["date"].isoformat()) for g in updated_slot.get("guests", [])]
-    all_timestamps = player_timestamps + guest_timestamps
+    slot = await collection.find_one({"date": target_date})
+    if not slot:
+        raise HTTPException(status_code=404, detail="Créneau non trouvé")
     
-    return SlotResponse(
-        date=updated_slot["date"].isoformat(),
-        players=players_list + guests_list,
-        player_count=total_registered,
-        max_players=MAX_PLAYERS,
-        timestamps=all_timestamps
+    is_admin = user["role"] == "admin"
+    user_id = str(user["_id"])
+    requested = set(bulk.players)
+    
+    requested_guests = {_parse_guest_label(entry) for entry in requested} - {None}
+    
+    player_names = []
+    for player in slot.get("players", []):
+        if player["username"] in requested:
+            if not (is_admin or player["user_id"] == user_id):
+                raise HTTPException(status_code=403, detail="Vous ne pouvez pas supprimer cette inscription")
+            player_names.append(player["username"])
+    
+    guest_names = []
+    for guest in slot.get("guests", []):
+        if guest["name"] in requested_guests:
+            if not (is_admin or guest.get("invitedBy_id") == user_id):
+                raise HTTPException(status_code=403, detail="Vous ne pouvez pas supprimer cette inscription")
+            guest_names.append(guest["name"])
+    
+    if not player_names and not guest_names:
+        raise HTTPException(status_code=404, detail="Joueur non trouvé")
+    
+    await collection.update_one(
+        {"date": target_date},
+        {"$inc": {"version": 1}, "$pull": {
+            "players": {"username": {"$in": player_names}},
+            "guests": {"name": {"$in": guest_names}}
+        }}
     )
+    
+    updated_slot = await collection.find_one({"date": target_date})
+    return _build_slot_response(updated_slot)
 
 
 # =============================================================================
@@ -734,7 +839,7 @@ async def set_team_composition(teams: TeamComposition, admin_username: str):
     # Update team composition
     await collection.update_one(
         {"date": target_date},
-        {"$set": {
+        {"$inc": {"version": 1}, "$set": {
             "teamA": teams.teamA,
             "teamB": teams.teamB
         }}
@@ -784,7 +889,8 @@ async def set_team_composition(teams: TeamComposition, admin_username: str):
         teamB=teamB_details,
         teamAScore=updated_slot.get("teamAScore"),
         teamBScore=updated_slot.get("teamBScore"),
-        isRegistrationOpen=is_registration_open()
+        isRegistrationOpen=is_registration_open(),
+        version=updated_slot.get("version", 0)
     )
 
 @app.get("/api/admin/slot-details")
@@ -871,7 +977,7 @@ async def set_team_scores(scores: TeamScores, admin_username: str):
     # Update scores
     await collection.update_one(
         {"date": target_date},
-        {"$set": {
+        {"$inc": {"version": 1}, "$set": {
             "teamAScore": scores.teamAScore,
             "teamBScore": scores.teamBScore
         }}
@@ -921,7 +1027,8 @@ async def set_team_scores(scores: TeamScores, admin_username: str):
         teamB=teamB_details,
         teamAScore=updated_slot.get("teamAScore"),
         teamBScore=updated_slot.get("teamBScore"),
-        isRegistrationOpen=is_registration_open()
+        isRegistrationOpen=is_registration_open(),
+        version=updated_slot.get("version", 0)
     )
 
 
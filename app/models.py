@@ -57,6 +57,7 @@ class SlotResponse(BaseModel):
     teamAScore: Optional[int] = Field(default=None, description="Team A score")
     teamBScore: Optional[int] = Field(default=None, description="Team B score")
     isRegistrationOpen: bool = Field(default=True, description="Whether registration is currently allowed")
+    version: int = Field(default=0, description="Monotonic counter incremented on every slot mutation")
 
 
 class User(BaseModel):
@@ -106,6 +107,11 @@ class GuestRegistration(BaseModel):
     guestName: str
 
 
+class BulkUnregistration(BaseModel):
+    """Request model for removing several players/guests at once"""
+    players: List[str] = Field(..., min_length=1, description="Player names or '(Invité) Name [par user]' guest entries")
+
+
 class ChangePinRequest(BaseModel):
     old_pin: str
     new_pin: str
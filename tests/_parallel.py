@@ -0,0 +1,58 @@
+"""
+Shared helper for running independent test suites concurrently
+Each worker thread prints into its own buffer; output is replayed suite by suite, in order
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Per-thread output buffer used while suites run concurrently
+_suite_output = threading.local()
+
+
+class _SuiteStdout:
+    """sys.stdout proxy that sends each worker thread's prints to its own buffer"""
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        return getattr(_suite_output, "buffer", self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
+def run_suites_parallel(suites, run_suite=None, on_error=None, max_workers: int = 4):
+    """Run independent test suites concurrently. Returns one result per suite, in order
+
+    run_suite(suite) runs a single suite (default: suite()) and is called on a worker thread.
+    A suite that raises does not stop the others: its result is on_error(suite, error)
+    (default: None), computed on the same worker so anything it prints lands in that suite's output.
+    """
+    if run_suite is None:
+        run_suite = lambda suite: suite()
+
+    def run(suite):
+        _suite_output.buffer = io.StringIO()
+        try:
+            try:
+                result = run_suite(suite)
+            except Exception as e:
+                result = on_error(suite, e) if on_error else None
+            return result, _suite_output.buffer.getvalue()
+        finally:
+            del _suite_output.buffer
+
+    original_stdout = sys.stdout
+    sys.stdout = _SuiteStdout(original_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run, suites))
+    finally:
+        sys.stdout = original_stdout
+
+    for _, output in results:
+        print(output, end="")
+    return [result for result, _ in results]
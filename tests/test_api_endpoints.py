@@ -6,10 +6,19 @@ No code imports - pure black-box API testing
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 import time
-import random
+from collections import defaultdict
+import itertools
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from _parallel import run_suites_parallel
 
 
 # Configuration
@@ -17,6 +26,17 @@ BASE_URL = "http://192.168.0.100:8000"
 API_BASE = f"{BASE_URL}/api"
 MAX_PLAYERS = 10  # Business rule constant
 
+# ISO 8601 timestamp format (validation only, no parsing)
+ISO_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?$')
+
+# Expected keywords in API error messages (case-insensitive, single pass)
+FR_DUP_RE = re.compile(r"déjà|deja|inscrit", re.IGNORECASE)
+FR_FULL_RE = re.compile(r"complet", re.IGNORECASE)
+FR_AUTH_RE = re.compile(r"authentification|requise?", re.IGNORECASE)
+SLOT_FULL_RE = re.compile(r"complet|full", re.IGNORECASE)
+FR_INFO_RE = re.compile("|".join(map(re.escape, ["supprimer", "permission", "pas", "trouvé"])), re.IGNORECASE)
+PERMISSION_ERROR_RE = re.compile(r"permission|supprimer|403", re.IGNORECASE)
+
 # Test User Credentials (CONFIGURE THESE FOR YOUR SYSTEM)
 # You need to create these users in your system before running tests
 ADMIN_USERNAME = "admin"
@@ -39,11 +59,20 @@ class Colors:
     BOLD = '\033[1m'
 
 
+# Precomputed compound styles for headers and the summary/cleanup output
+BOLD_BLUE = Colors.BOLD + Colors.BLUE
+BOLD_GREEN = Colors.BOLD + Colors.GREEN
+BOLD_RED = Colors.BOLD + Colors.RED
+BOLD_YELLOW = Colors.BOLD + Colors.YELLOW
+BAR80_BLUE = f"{BOLD_BLUE}{'='*80}{Colors.RESET}"
+BAR80_RED = f"{BOLD_RED}{'='*80}{Colors.RESET}"
+
+
 def print_test_header(category: str):
     """Print test category header"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{category.center(80)}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.RESET}\n")
+    print(f"\n{BAR80_BLUE}")
+    print(f"{BOLD_BLUE}{category.center(80)}{Colors.RESET}")
+    print(f"{BAR80_BLUE}\n")
 
 
 def print_test(test_name: str, passed: bool, details: str = ""):
@@ -74,28 +103,19 @@ class TestRunner:
         self.failed_tests = []  # Track failed tests
         self.suite_name = suite_name
     
-    def run_test(self, test_name: str, test_func, expected_result=True, details=""):
-        """Run a test and record result"""
+    def run_test_bool(self, test_name: str, actual, expected_result=True, details=""):
+        """Record the result of an already-evaluated test"""
         self.total += 1
-        try:
-            result = test_func()
-            passed = (result == expected_result)
-            if passed:
-                self.passed += 1
-            else:
-                self.failed_tests.append({
-                    'name': test_name,
-                    'details': details or f"Expected: {expected_result}, Got: {result}",
-                    'suite': self.suite_name
-                })
-            print_test(test_name, passed, details or f"Expected: {expected_result}, Got: {result}")
-        except Exception as e:
+        passed = (actual == expected_result)
+        if passed:
+            self.passed += 1
+        else:
             self.failed_tests.append({
                 'name': test_name,
-                'details': f"Exception: {str(e)}",
+                'details': details or f"Expected: {expected_result}, Got: {actual}",
                 'suite': self.suite_name
             })
-            print_test(test_name, False, f"Exception: {str(e)}")
+        print_test(test_name, passed, details or f"Expected: {expected_result}, Got: {actual}")
     
     def print_summary(self):
         """Print final summary"""
@@ -106,37 +126,93 @@ class TestRunner:
 # API HELPER FUNCTIONS
 # =============================================================================
 
+# Shared HTTP session: keeps connections alive across all API calls.
+# Pool is sized above MAX_WORKERS so concurrent batches never wait for a socket.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+SESSION.headers.update({"Connection": "keep-alive"})
+
+# Upper bound on concurrent requests issued by the batch helpers
+MAX_WORKERS = 10
+
+# Monotonic counter for guest names (PID suffix keeps parallel runs apart)
+_guest_counter = itertools.count()
+
+
+def unique_guest(prefix: str) -> str:
+    """Build a guest name that is unique for this test run"""
+    return f"{prefix}_{next(_guest_counter)}_{os.getpid()}"
+
+
 def check_server_running() -> bool:
     """Check if the server is running"""
     try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/health", timeout=5)
         return response.status_code == 200
     except:
         return False
 
 
-def get_current_slot():
-    """Get current slot via API"""
+# Back-to-back slot reads within this window share one response (see get_current_slot)
+SLOT_CACHE_TTL = 0.1
+# Suites run concurrently: "generation" is bumped on every invalidation so a GET that
+# started before a mutation cannot store its (now stale) response afterwards
+_slot_cache = {"data": None, "fetched_at": 0.0, "generation": 0}
+_slot_cache_lock = threading.Lock()
+
+
+def invalidate_slot_cache():
+    """Force the next get_current_slot() call to hit the server"""
+    with _slot_cache_lock:
+        _slot_cache["fetched_at"] = 0.0
+        _slot_cache["generation"] += 1
+
+
+def get_current_slot(force: bool = False):
+    """Get current slot via API (cached for SLOT_CACHE_TTL seconds unless force=True)"""
+    with _slot_cache_lock:
+        now = time.monotonic()
+        if not force and _slot_cache["data"] is not None and now - _slot_cache["fetched_at"] < SLOT_CACHE_TTL:
+            return _slot_cache["data"]
+        generation = _slot_cache["generation"]
     try:
-        response = requests.get(f"{API_BASE}/current-slot", timeout=5)
+        response = SESSION.get(f"{API_BASE}/current-slot", timeout=5)
         if response.status_code == 200:
-            return response.json()
+            data = response.json()
+            with _slot_cache_lock:
+                if _slot_cache["generation"] == generation:
+                    _slot_cache["data"], _slot_cache["fetched_at"] = data, time.monotonic()
+            return data
         return None
     except Exception as e:
         print(f"Error getting slot: {e}")
         return None
 
 
+def get_player_count():
+    """Get only the current player count via API. Returns None on error"""
+    try:
+        response = SESSION.get(f"{API_BASE}/current-slot/count", timeout=5)
+        if response.status_code == 200:
+            return response.json().get("player_count")
+        return None
+    except Exception as e:
+        print(f"Error getting player count: {e}")
+        return None
+
+
 def register_player(username: str, name: str):
     """Register a player via API. Returns (success, message, response_data)"""
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             json={"name": name},
             params={"username": username},
             timeout=5
         )
         if response.status_code == 200:
+            invalidate_slot_cache()
             return True, "Success", response.json()
         else:
             error_detail = response.json().get("detail", "Unknown error")
@@ -148,13 +224,14 @@ def register_player(username: str, name: str):
 def register_guest(username: str, guest_name: str):
     """Register a guest via API. Returns (success, message, response_data)"""
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register-guest",
             json={"guestName": guest_name},
             params={"username": username},
             timeout=5
         )
         if response.status_code == 200:
+            invalidate_slot_cache()
             return True, "Success", response.json()
         else:
             error_detail = response.json().get("detail", "Unknown error")
@@ -166,12 +243,13 @@ def register_guest(username: str, guest_name: str):
 def unregister_player(username: str, player_name: str):
     """Unregister a player via API. Returns (success, message)"""
     try:
-        response = requests.delete(
+        response = SESSION.delete(
             f"{API_BASE}/unregister/{player_name}",
             params={"username": username},
             timeout=5
         )
         if response.status_code == 200:
+            invalidate_slot_cache()
             return True, "Success"
         else:
             error_detail = response.json().get("detail", "Unknown error")
@@ -183,7 +261,7 @@ def unregister_player(username: str, player_name: str):
 def login(username: str, pin: str):
     """Login via API. Returns (success, user_data)"""
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/auth/login",
             json={"username": username, "pin": pin},
             timeout=5
@@ -197,6 +275,165 @@ def login(username: str, pin: str):
         return False, None
 
 
+def wait_until(predicate, timeout: float = 2.0, interval: float = 0.02):
+    """Poll predicate until it returns a truthy value or timeout elapses. Returns the last result"""
+    deadline = time.monotonic() + timeout
+    while True:
+        result = predicate()
+        if result or time.monotonic() >= deadline:
+            return result
+        time.sleep(interval)
+
+
+def player_in_slot(entry: str) -> bool:
+    """Check whether an exact players entry is currently in the slot"""
+    return entry in (get_current_slot(force=True) or {}).get("players", ())
+
+
+def slot_version(slot):
+    """Return the slot's mutation counter, or None if unknown (no slot or older server)"""
+    return slot.get("version") if slot else None
+
+
+def wait_for_version_change(prev_version, timeout: float = 2.0):
+    """Poll the slot until its version moves past prev_version. Returns the latest slot"""
+    if prev_version is None:
+        return get_current_slot()
+    latest = None
+    def advanced():
+        nonlocal latest
+        latest = get_current_slot(force=True)
+        return latest is not None and latest.get("version", 0) > prev_version
+    wait_until(advanced, timeout=timeout)
+    return latest
+
+
+def register_guests(username: str, guest_names):
+    """Register several guests concurrently. Returns a list of (success, message, response_data)"""
+    if not guest_names:
+        return []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(lambda name: register_guest(username, name), guest_names))
+
+
+def unregister_players(username: str, player_names):
+    """Unregister several players concurrently. Returns a list of (success, message)"""
+    if not player_names:
+        return []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(lambda name: unregister_player(username, name), player_names))
+
+
+def ensure_unregistered(*usernames):
+    """Make sure the given users are not registered. Only issues a DELETE for users actually in the slot"""
+    slot = get_current_slot(force=True)
+    if slot is None:
+        present = list(usernames)  # Slot unknown: fall back to unconditional unregistration
+    else:
+        players = set(slot.get("players", ()))
+        present = [u for u in usernames if u in players]
+    if len(present) == 1:
+        unregister_player(present[0], present[0])
+    elif present:
+        with ThreadPoolExecutor(max_workers=min(len(present), MAX_WORKERS)) as executor:
+            list(executor.map(lambda u: unregister_player(u, u), present))
+
+
+def bulk_unregister(username: str, player_names):
+    """Remove several players in one request. Returns (removed_count, message)
+
+    Falls back to per-player unregistration when the server has no bulk endpoint.
+    """
+    if not player_names:
+        return 0, "Nothing to remove"
+    try:
+        response = SESSION.post(
+            f"{API_BASE}/unregister-bulk",
+            json={"players": list(player_names)},
+            params={"username": username},
+            timeout=5
+        )
+        if response.status_code == 200:
+            invalidate_slot_cache()
+            remaining = set(response.json().get("players", ()))
+            return sum(1 for p in player_names if p not in remaining), "Success"
+        try:
+            error_detail = response.json().get("detail")
+        except ValueError:
+            error_detail = None
+        # 404/405 with no app-specific detail means the route itself is missing
+        route_missing = response.status_code in (404, 405) and error_detail in (
+            None, "Not Found", "Method Not Allowed", response.reason
+        )
+        if not route_missing:
+            return 0, error_detail or "Unknown error"
+    except Exception as e:
+        return 0, str(e)
+    # Route missing (older server or proxy): unregister one by one
+    results = unregister_players(username, player_names)
+    return sum(1 for success, _ in results if success), "Fallback: per-player unregistration"
+
+
+def post_bulk_unregister(username: str, player_names):
+    """POST to the bulk endpoint with no fallback. Returns the status code (None on error)"""
+    try:
+        response = SESSION.post(
+            f"{API_BASE}/unregister-bulk",
+            json={"players": list(player_names)},
+            params={"username": username},
+            timeout=5
+        )
+    except Exception as e:
+        print(f"Error calling bulk unregister: {e}")
+        return None
+    if response.status_code == 200:
+        invalidate_slot_cache()
+    return response.status_code
+
+
+def admin_post(path: str, admin_username: str, payload: dict):
+    """POST a payload to an admin endpoint. Returns (success, message)"""
+    try:
+        response = SESSION.post(
+            f"{API_BASE}/admin/{path}",
+            json=payload,
+            params={"admin_username": admin_username},
+            timeout=5
+        )
+        if response.status_code == 200:
+            invalidate_slot_cache()
+            return True, "Success"
+        return False, response.json().get("detail", "Unknown error")
+    except Exception as e:
+        return False, str(e)
+
+
+def get_slot_details(admin_username: str):
+    """Get the admin slot view (entries with their IDs). Returns None on error"""
+    try:
+        response = SESSION.get(
+            f"{API_BASE}/admin/slot-details",
+            params={"admin_username": admin_username},
+            timeout=5
+        )
+        return response.json() if response.status_code == 200 else None
+    except Exception as e:
+        print(f"Error getting slot details: {e}")
+        return None
+
+
+def player_key(entry: str) -> str:
+    """Extract the lookup name from a players entry ("(Invité) Name [par user]" -> "Name")"""
+    if entry.startswith("(Invité) "):
+        return entry[len("(Invité) "):].split(" [par ", 1)[0]
+    return entry
+
+
+def index_players(slot) -> dict:
+    """Map player/guest names to their raw players entry in one pass"""
+    return {player_key(p): p for p in (slot or {}).get("players", ())}
+
+
 # =============================================================================
 # SERVER CONNECTIVITY TESTS
 # =============================================================================
@@ -208,38 +445,38 @@ def test_server_connectivity():
     
     # Test 1: Health endpoint
     test_name = "Server health endpoint should respond"
-    runner.run_test(test_name, lambda: check_server_running(), True,
-                   f"GET {BASE_URL}/health")
+    runner.run_test_bool(test_name, check_server_running(), True,
+                        f"GET {BASE_URL}/health")
     
     # Test 2: Root endpoint
     test_name = "Root endpoint should return HTML"
     try:
-        response = requests.get(BASE_URL, timeout=5)
+        response = SESSION.get(BASE_URL, timeout=5)
         success = response.status_code == 200 and "text/html" in response.headers.get("content-type", "")
-        runner.run_test(test_name, lambda: success, True,
-                       f"GET {BASE_URL} -> Status: {response.status_code}")
+        runner.run_test_bool(test_name, success, True,
+                            f"GET {BASE_URL} -> Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 3: API current-slot endpoint
     test_name = "API current-slot endpoint should respond"
     try:
-        response = requests.get(f"{API_BASE}/current-slot", timeout=5)
+        response = SESSION.get(f"{API_BASE}/current-slot", timeout=5)
         success = response.status_code == 200
-        runner.run_test(test_name, lambda: success, True,
-                       f"GET {API_BASE}/current-slot -> Status: {response.status_code}")
+        runner.run_test_bool(test_name, success, True,
+                            f"GET {API_BASE}/current-slot -> Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 4: Admin page endpoint
     test_name = "Admin page endpoint should respond"
     try:
-        response = requests.get(f"{BASE_URL}/admin", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/admin", timeout=5)
         success = response.status_code == 200
-        runner.run_test(test_name, lambda: success, True,
-                       f"GET {BASE_URL}/admin -> Status: {response.status_code}")
+        runner.run_test_bool(test_name, success, True,
+                            f"GET {BASE_URL}/admin -> Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     runner.print_summary()
     return runner
@@ -257,47 +494,47 @@ def test_slot_retrieval():
     # Test 1: Get current slot
     test_name = "Should retrieve current slot data"
     slot = get_current_slot()
-    runner.run_test(test_name, lambda: slot is not None, True,
-                   f"Slot retrieved: {slot is not None}")
+    runner.run_test_bool(test_name, slot is not None, True,
+                        f"Slot retrieved: {slot is not None}")
     
     if slot:
         # Test 2: Slot should have date field
         test_name = "Slot should have 'date' field"
-        runner.run_test(test_name, lambda: "date" in slot, True,
-                       f"Date: {slot.get('date', 'N/A')}")
+        runner.run_test_bool(test_name, "date" in slot, True,
+                            f"Date: {slot.get('date', 'N/A')}")
         
         # Test 3: Slot should have players field
         test_name = "Slot should have 'players' field"
-        runner.run_test(test_name, lambda: "players" in slot, True,
-                       f"Players: {slot.get('players', [])}")
+        runner.run_test_bool(test_name, "players" in slot, True,
+                            f"Players: {slot.get('players', [])}")
         
         # Test 4: Slot should have player_count field
         test_name = "Slot should have 'player_count' field"
-        runner.run_test(test_name, lambda: "player_count" in slot, True,
-                       f"Player count: {slot.get('player_count', 'N/A')}")
+        runner.run_test_bool(test_name, "player_count" in slot, True,
+                            f"Player count: {slot.get('player_count', 'N/A')}")
         
         # Test 5: Slot should have max_players field set to 10
         test_name = "Slot should have 'max_players' field set to 10"
-        runner.run_test(test_name, lambda: slot.get("max_players") == 10, True,
-                       f"Max players: {slot.get('max_players', 'N/A')}")
+        runner.run_test_bool(test_name, slot.get("max_players") == 10, True,
+                            f"Max players: {slot.get('max_players', 'N/A')}")
         
         # Test 6: Player count should match players list length
         test_name = "player_count should match players list length"
         player_count = slot.get("player_count", 0)
         players_length = len(slot.get("players", []))
-        runner.run_test(test_name, lambda: player_count == players_length, True,
-                       f"Count: {player_count}, List length: {players_length}")
+        runner.run_test_bool(test_name, player_count == players_length, True,
+                            f"Count: {player_count}, List length: {players_length}")
         
         # Test 7: Date should be valid ISO format
         test_name = "Date should be valid ISO 8601 format"
         try:
             date_str = slot.get("date", "")
             parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            runner.run_test(test_name, lambda: True, True,
-                           f"Date: {date_str}")
+            runner.run_test_bool(test_name, True, True,
+                                f"Date: {date_str}")
         except:
-            runner.run_test(test_name, lambda: False, True,
-                           f"Invalid date format: {slot.get('date')}")
+            runner.run_test_bool(test_name, False, True,
+                                f"Invalid date format: {slot.get('date')}")
         
         # Test 8: Date should be Wednesday at 19:00
         test_name = "Slot date should be a Wednesday at 19:00"
@@ -306,15 +543,22 @@ def test_slot_retrieval():
             parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
             is_wednesday = parsed.weekday() == 2
             is_19_00 = parsed.hour == 19 and parsed.minute == 0
-            runner.run_test(test_name, lambda: is_wednesday and is_19_00, True,
-                           f"Day: {parsed.strftime('%A')}, Time: {parsed.strftime('%H:%M')}")
+            runner.run_test_bool(test_name, is_wednesday and is_19_00, True,
+                                f"Day: {parsed.strftime('%A')}, Time: {parsed.strftime('%H:%M')}")
         except:
-            runner.run_test(test_name, lambda: False, True, "Could not parse date")
+            runner.run_test_bool(test_name, False, True, "Could not parse date")
         
         # Test 9: Players should be a list
         test_name = "Players field should be a list"
-        runner.run_test(test_name, lambda: isinstance(slot.get("players"), list), True,
-                       f"Type: {type(slot.get('players'))}")
+        runner.run_test_bool(test_name, isinstance(slot.get("players"), list), True,
+                            f"Type: {type(slot.get('players'))}")
+        
+        # Test 10: Count endpoint agrees with the full slot (phase 1 never modifies the slot)
+        test_name = "/current-slot/count should match the slot's player_count"
+        count_only = get_player_count()
+        full_count = (get_current_slot(force=True) or {}).get("player_count")
+        runner.run_test_bool(test_name, count_only is not None and count_only == full_count, True,
+                            f"Count endpoint: {count_only}, Full slot: {full_count}")
     
     runner.print_summary()
     return runner
@@ -332,28 +576,28 @@ def test_authentication():
     # Test 1: Login with invalid credentials
     test_name = "Login with invalid credentials should fail"
     success, user = login("nonexistent_user", "0000")
-    runner.run_test(test_name, lambda: not success, True,
-                   f"Login failed as expected")
+    runner.run_test_bool(test_name, not success, True,
+                        f"Login failed as expected")
     
     # Test 2: Login endpoint should return proper structure
     test_name = "Login response should have success field"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/auth/login",
             json={"username": "test", "pin": "1234"},
             timeout=5
         )
         data = response.json()
         has_success = "success" in data
-        runner.run_test(test_name, lambda: has_success, True,
-                       f"Response keys: {list(data.keys())}")
+        runner.run_test_bool(test_name, has_success, True,
+                            f"Response keys: {list(data.keys())}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 3: Login with empty username should fail
     test_name = "Login with empty username should fail"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/auth/login",
             json={"username": "", "pin": "1234"},
             timeout=5
@@ -365,25 +609,25 @@ def test_authentication():
         else:
             login_failed = response.status_code in [400, 401, 422]
         
-        runner.run_test(test_name, lambda: login_failed, True,
-                       f"Status: {response.status_code}, Login rejected: {login_failed}")
+        runner.run_test_bool(test_name, login_failed, True,
+                            f"Status: {response.status_code}, Login rejected: {login_failed}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 4: Signup endpoint should reject invalid invite token
     test_name = "Signup endpoint should reject invalid invite token"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/auth/signup",
             json={"username": "testuser", "pin": "1234", "inviteToken": "fake"},
             timeout=5
         )
         # Should reject with error status (not 200)
         rejected = response.status_code in [400, 401, 403, 422]
-        runner.run_test(test_name, lambda: rejected, True,
-                       f"Status: {response.status_code}, Rejected: {rejected}")
+        runner.run_test_bool(test_name, rejected, True,
+                            f"Status: {response.status_code}, Rejected: {rejected}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     runner.print_summary()
     return runner
@@ -401,20 +645,20 @@ def test_registration_without_auth():
     # Test 1: Register without authentication should fail
     test_name = "Registration without valid username should fail"
     success, message, data = register_player("nonexistent_user_12345", "TestPlayer")
-    runner.run_test(test_name, lambda: not success, True,
-                   f"Registration blocked: {message}")
+    runner.run_test_bool(test_name, not success, True,
+                        f"Registration blocked: {message}")
     
     # Test 2: Guest registration without auth should fail
     test_name = "Guest registration without valid username should fail"
     success, message, data = register_guest("nonexistent_user_12345", "TestGuest")
-    runner.run_test(test_name, lambda: not success, True,
-                   f"Guest registration blocked: {message}")
+    runner.run_test_bool(test_name, not success, True,
+                        f"Guest registration blocked: {message}")
     
     # Test 3: Unregister without auth should fail
     test_name = "Unregistration without valid username should fail"
     success, message = unregister_player("nonexistent_user_12345", "SomePlayer")
-    runner.run_test(test_name, lambda: not success, True,
-                   f"Unregistration blocked: {message}")
+    runner.run_test_bool(test_name, not success, True,
+                        f"Unregistration blocked: {message}")
     
     runner.print_summary()
     return runner
@@ -429,100 +673,102 @@ def test_input_validation():
     print_test_header("INPUT VALIDATION TESTS")
     runner = TestRunner("Input Validation")
     
+    # Requests are made as an unknown user: validation runs before authentication, and
+    # anything that gets past it is refused with 403, so the slot is never modified
     # Test 1: Empty player name validation
     test_name = "API should reject empty player name"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             json={"name": ""},
-            params={"username": "testuser"},
+            params={"username": "nonexistent_user_12345"},
             timeout=5
         )
         # Should return validation error (422 or 400)
         rejected = response.status_code in [400, 422]
-        runner.run_test(test_name, lambda: rejected, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, rejected, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 2: Whitespace-only name validation
     test_name = "API should reject whitespace-only name"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             json={"name": "   "},
-            params={"username": "testuser"},
+            params={"username": "nonexistent_user_12345"},
             timeout=5
         )
         rejected = response.status_code in [400, 422]
-        runner.run_test(test_name, lambda: rejected, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, rejected, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 3: Very long name (>100 chars)
     test_name = "API should handle very long name (101 chars)"
     try:
         long_name = "A" * 101
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             json={"name": long_name},
-            params={"username": "testuser"},
+            params={"username": "nonexistent_user_12345"},
             timeout=5
         )
         # Should either accept or reject gracefully
         handled = response.status_code in [200, 400, 422]
-        runner.run_test(test_name, lambda: handled, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, handled, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 4: Special characters in name
     test_name = "API should accept name with special characters"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             json={"name": "Jean-François O'Brien"},
-            params={"username": "testuser"},
+            params={"username": "nonexistent_user_12345"},
             timeout=5
         )
-        # Should respond (may fail auth, but not validation)
+        # Passes validation, then fails auth (unknown user) without touching the slot
         handled = response.status_code in [200, 400, 403, 422]
-        runner.run_test(test_name, lambda: handled, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, handled, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 5: Missing required field
     test_name = "API should reject request with missing 'name' field"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             json={},
-            params={"username": "testuser"},
+            params={"username": "nonexistent_user_12345"},
             timeout=5
         )
         rejected = response.status_code == 422
-        runner.run_test(test_name, lambda: rejected, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, rejected, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 6: Invalid JSON
     test_name = "API should reject invalid JSON"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             data="not valid json",
-            params={"username": "testuser"},
+            params={"username": "nonexistent_user_12345"},
             headers={"Content-Type": "application/json"},
             timeout=5
         )
         rejected = response.status_code in [400, 422]
-        runner.run_test(test_name, lambda: rejected, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, rejected, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     runner.print_summary()
     return runner
@@ -541,30 +787,30 @@ def test_business_logic_via_api():
     test_name = "Slot max_players should be set to 10"
     slot = get_current_slot()
     if slot:
-        runner.run_test(test_name, lambda: slot.get("max_players") == 10, True,
-                       f"Max players: {slot.get('max_players')}")
+        runner.run_test_bool(test_name, slot.get("max_players") == 10, True,
+                            f"Max players: {slot.get('max_players')}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+        runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
     
     # Test 2: Player count should be between 0 and 10
     test_name = "Player count should be between 0 and 10"
     if slot:
         count = slot.get("player_count", 0)
         valid_range = 0 <= count <= 10
-        runner.run_test(test_name, lambda: valid_range, True,
-                       f"Player count: {count}")
+        runner.run_test_bool(test_name, valid_range, True,
+                            f"Player count: {count}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+        runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
     
     # Test 3: Players list length should not exceed 10
     test_name = "Players list should not exceed 10 entries"
     if slot:
         players_count = len(slot.get("players", []))
         not_exceeded = players_count <= 10
-        runner.run_test(test_name, lambda: not_exceeded, True,
-                       f"Players: {players_count}/10")
+        runner.run_test_bool(test_name, not_exceeded, True,
+                            f"Players: {players_count}/10")
     else:
-        runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+        runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
     
     runner.print_summary()
     return runner
@@ -582,46 +828,46 @@ def test_error_handling():
     # Test 1: Unregister non-existent player
     test_name = "Unregister non-existent player should return error"
     try:
-        response = requests.delete(
+        response = SESSION.delete(
             f"{API_BASE}/unregister/NonExistentPlayer999",
             params={"username": "testuser"},
             timeout=5
         )
         # Should return error (404 or 400 or 403)
         has_error = response.status_code in [400, 403, 404]
-        runner.run_test(test_name, lambda: has_error, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, has_error, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 2: Invalid endpoint should return 404
     test_name = "Invalid endpoint should return 404"
     try:
-        response = requests.get(f"{API_BASE}/invalid-endpoint-xyz", timeout=5)
+        response = SESSION.get(f"{API_BASE}/invalid-endpoint-xyz", timeout=5)
         is_404 = response.status_code == 404
-        runner.run_test(test_name, lambda: is_404, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, is_404, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 3: Missing username parameter
     test_name = "Registration without username param should fail"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             json={"name": "TestPlayer"},
             timeout=5
         )
         has_error = response.status_code in [400, 422]
-        runner.run_test(test_name, lambda: has_error, True,
-                       f"Status: {response.status_code}")
+        runner.run_test_bool(test_name, has_error, True,
+                            f"Status: {response.status_code}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     # Test 4: Error responses should have detail field
     test_name = "Error responses should contain 'detail' field"
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_BASE}/register",
             json={"name": "Test"},
             params={"username": "fake_user_xyz"},
@@ -630,13 +876,13 @@ def test_error_handling():
         if response.status_code >= 400:
             data = response.json()
             has_detail = "detail" in data
-            runner.run_test(test_name, lambda: has_detail, True,
-                           f"Error format correct")
+            runner.run_test_bool(test_name, has_detail, True,
+                                f"Error format correct")
         else:
-            runner.run_test(test_name, lambda: True, True,
-                           "No error to test (unexpected success)")
+            runner.run_test_bool(test_name, True, True,
+                                "No error to test (unexpected success)")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test_bool(test_name, False, True, f"Error: {e}")
     
     runner.print_summary()
     return runner
@@ -654,31 +900,31 @@ def test_normal_user_authentication():
     # Test 1: Login with valid normal user credentials
     test_name = f"Login as normal user '{NORMAL_USER_USERNAME}' should succeed"
     success, user_data = login(NORMAL_USER_USERNAME, NORMAL_USER_PIN)
-    runner.run_test(test_name, lambda: success, True,
-                   f"User: {user_data if success else 'Login failed'}")
+    runner.run_test_bool(test_name, success, True,
+                        f"User: {user_data if success else 'Login failed'}")
     
     if success and user_data:
         # Test 2: User should have username field
         test_name = "User data should contain username"
-        runner.run_test(test_name, lambda: "username" in user_data, True,
-                       f"Username: {user_data.get('username')}")
+        runner.run_test_bool(test_name, "username" in user_data, True,
+                            f"Username: {user_data.get('username')}")
         
         # Test 3: User should have role field
         test_name = "User data should contain role"
-        runner.run_test(test_name, lambda: "role" in user_data, True,
-                       f"Role: {user_data.get('role')}")
+        runner.run_test_bool(test_name, "role" in user_data, True,
+                            f"Role: {user_data.get('role')}")
         
         # Test 4: Normal user role should not be 'admin'
         test_name = "Normal user role should be 'user' (not 'admin')"
         is_user = user_data.get("role") == "user"
-        runner.run_test(test_name, lambda: is_user, True,
-                       f"Role: {user_data.get('role')}")
+        runner.run_test_bool(test_name, is_user, True,
+                            f"Role: {user_data.get('role')}")
     
     # Test 5: Login with wrong PIN should fail
     test_name = "Login with correct username but wrong PIN should fail"
     success, user_data = login(NORMAL_USER_USERNAME, "0000")
-    runner.run_test(test_name, lambda: not success, True,
-                   f"Failed as expected")
+    runner.run_test_bool(test_name, not success, True,
+                        f"Failed as expected")
     
     runner.print_summary()
     return runner
@@ -693,36 +939,37 @@ def test_normal_user_registration():
     unregister_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
     time.sleep(0.3)
     
-    # Get initial slot state
-    initial_slot = get_current_slot()
-    initial_count = initial_slot.get("player_count", 0) if initial_slot else 0
+    # Get initial slot state (None if the count endpoint failed)
+    initial_count = get_player_count()
     
     # Test 1: Register as normal user
     test_name = f"Normal user '{NORMAL_USER_USERNAME}' should register successfully"
     success, message, data = register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    runner.run_test(test_name, lambda: success, True,
-                   f"Registration: {message if not success else 'Success'}")
+    runner.run_test_bool(test_name, success, True,
+                        f"Registration: {message if not success else 'Success'}")
     
     if success and data:
         # Test 2: Player count should increase
         test_name = "Player count should increase after registration"
         new_count = data.get("player_count", 0)
-        increased = new_count > initial_count or NORMAL_USER_USERNAME in data.get("players", [])
-        runner.run_test(test_name, lambda: increased, True,
-                       f"Count: {initial_count} → {new_count}")
+        increased = initial_count is not None and (
+            new_count > initial_count or NORMAL_USER_USERNAME in data.get("players", [])
+        )
+        runner.run_test_bool(test_name, increased, True,
+                            f"Count: {initial_count} → {new_count}")
         
         # Test 3: User should appear in players list
         test_name = "User should appear in players list"
         players = data.get("players", [])
         in_list = NORMAL_USER_USERNAME in players
-        runner.run_test(test_name, lambda: in_list, True,
-                       f"Players: {players}")
+        runner.run_test_bool(test_name, in_list, True,
+                            f"Players: {players}")
     
     # Test 4: Try to register again (should fail - duplicate)
     test_name = "Duplicate registration should be rejected"
     success2, message2, _ = register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    runner.run_test(test_name, lambda: not success2, True,
-                   f"Rejected: {message2}")
+    runner.run_test_bool(test_name, not success2, True,
+                        f"Rejected: {message2}")
     
     runner.print_summary()
     return runner
@@ -733,34 +980,34 @@ def test_normal_user_guest_registration():
     print_test_header("NORMAL USER - GUEST REGISTRATION TESTS")
     runner = TestRunner("Normal User Guest Registration")
     
-    guest_name = f"GuestUser_{random.randint(1000, 9999)}"
+    guest_name = unique_guest("GuestUser")
     
     # Test 1: Register a guest
     test_name = f"Normal user should be able to register a guest '{guest_name}'"
     success, message, data = register_guest(NORMAL_USER_USERNAME, guest_name)
-    runner.run_test(test_name, lambda: success, True,
-                   f"Guest registration: {message if not success else 'Success'}")
+    runner.run_test_bool(test_name, success, True,
+                        f"Guest registration: {message if not success else 'Success'}")
     
     if success and data:
         # Test 2: Guest should appear in players list with (Invité) prefix
         test_name = "Guest should appear with '(Invité)' prefix"
         players = data.get("players", [])
         guest_in_list = any(guest_name in p and "(Invité)" in p for p in players)
-        runner.run_test(test_name, lambda: guest_in_list, True,
-                       f"Guest found: {guest_in_list}")
+        runner.run_test_bool(test_name, guest_in_list, True,
+                            f"Guest found: {guest_in_list}")
         
         # Test 3: Guest entry should show who invited them
         test_name = f"Guest entry should show invited by '{NORMAL_USER_USERNAME}'"
-        guest_entry = next((p for p in players if guest_name in p), None)
+        guest_entry = index_players(data).get(guest_name)
         shows_inviter = guest_entry and NORMAL_USER_USERNAME in guest_entry
-        runner.run_test(test_name, lambda: shows_inviter, True,
-                       f"Entry: {guest_entry}")
+        runner.run_test_bool(test_name, shows_inviter, True,
+                            f"Entry: {guest_entry}")
     
     # Test 4: Try to register same guest name again (should fail)
     test_name = "Duplicate guest name should be rejected"
     success2, message2, _ = register_guest(NORMAL_USER_USERNAME, guest_name)
-    runner.run_test(test_name, lambda: not success2, True,
-                   f"Rejected: {message2}")
+    runner.run_test_bool(test_name, not success2, True,
+                        f"Rejected: {message2}")
     
     runner.print_summary()
     return runner
@@ -778,8 +1025,8 @@ def test_normal_user_unregistration():
     # Test 1: User should be able to unregister themselves
     test_name = f"User should be able to unregister themselves"
     success, message = unregister_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    runner.run_test(test_name, lambda: success, True,
-                   f"Unregistration: {message if not success else 'Success'}")
+    runner.run_test_bool(test_name, success, True,
+                        f"Unregistration: {message if not success else 'Success'}")
     
     if success:
         # Test 2: User should not appear in players list after unregistration
@@ -788,17 +1035,17 @@ def test_normal_user_unregistration():
         if slot:
             players = slot.get("players", [])
             not_in_list = NORMAL_USER_USERNAME not in players
-            runner.run_test(test_name, lambda: not_in_list, True,
-                           f"User removed: {not_in_list}")
+            runner.run_test_bool(test_name, not_in_list, True,
+                                f"User removed: {not_in_list}")
         else:
-            runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+            runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
     
     # Test 3: Try to unregister when not registered (should fail)
     test_name = "Unregister when not registered should fail"
     time.sleep(0.5)
     success2, message2 = unregister_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    runner.run_test(test_name, lambda: not success2, True,
-                   f"Error: {message2}")
+    runner.run_test_bool(test_name, not success2, True,
+                        f"Error: {message2}")
     
     runner.print_summary()
     return runner
@@ -817,14 +1064,14 @@ def test_normal_user_cannot_remove_others():
     # Test 1: Normal user should NOT be able to remove another user
     test_name = f"'{NORMAL_USER_USERNAME}' should NOT remove '{NORMAL_USER2_USERNAME}'"
     success, message = unregister_player(NORMAL_USER_USERNAME, NORMAL_USER2_USERNAME)
-    runner.run_test(test_name, lambda: not success, True,
-                   f"Blocked: {message}")
+    runner.run_test_bool(test_name, not success, True,
+                        f"Blocked: {message}")
     
     # Test 2: Error should mention permission/authorization
     test_name = "Error message should indicate permission issue"
-    has_permission_error = success == False and ("permission" in message.lower() or "supprimer" in message.lower() or "403" in str(message))
-    runner.run_test(test_name, lambda: has_permission_error, True,
-                   f"Message: {message}")
+    has_permission_error = success == False and bool(PERMISSION_ERROR_RE.search(str(message)))
+    runner.run_test_bool(test_name, has_permission_error, True,
+                        f"Message: {message}")
     
     runner.print_summary()
     return runner
@@ -842,25 +1089,25 @@ def test_admin_authentication():
     # Test 1: Login with valid admin credentials
     test_name = f"Login as admin user '{ADMIN_USERNAME}' should succeed"
     success, user_data = login(ADMIN_USERNAME, ADMIN_PIN)
-    runner.run_test(test_name, lambda: success, True,
-                   f"User: {user_data if success else 'Login failed'}")
+    runner.run_test_bool(test_name, success, True,
+                        f"User: {user_data if success else 'Login failed'}")
     
     if success and user_data:
         # Test 2: Admin should have username field
         test_name = "Admin data should contain username"
-        runner.run_test(test_name, lambda: "username" in user_data, True,
-                       f"Username: {user_data.get('username')}")
+        runner.run_test_bool(test_name, "username" in user_data, True,
+                            f"Username: {user_data.get('username')}")
         
         # Test 3: Admin should have role field
         test_name = "Admin data should contain role"
-        runner.run_test(test_name, lambda: "role" in user_data, True,
-                       f"Role: {user_data.get('role')}")
+        runner.run_test_bool(test_name, "role" in user_data, True,
+                            f"Role: {user_data.get('role')}")
         
         # Test 4: Admin role should be 'admin'
         test_name = "Admin user role should be 'admin'"
         is_admin = user_data.get("role") == "admin"
-        runner.run_test(test_name, lambda: is_admin, True,
-                       f"Role: {user_data.get('role')}")
+        runner.run_test_bool(test_name, is_admin, True,
+                            f"Role: {user_data.get('role')}")
     
     runner.print_summary()
     return runner
@@ -874,16 +1121,16 @@ def test_admin_registration():
     # Test 1: Admin can register themselves
     test_name = f"Admin '{ADMIN_USERNAME}' should register successfully"
     success, message, data = register_player(ADMIN_USERNAME, ADMIN_USERNAME)
-    runner.run_test(test_name, lambda: success, True,
-                   f"Registration: {message if not success else 'Success'}")
+    runner.run_test_bool(test_name, success, True,
+                        f"Registration: {message if not success else 'Success'}")
     
     if success and data:
         # Test 2: Admin should appear in players list
         test_name = "Admin should appear in players list"
         players = data.get("players", [])
         in_list = ADMIN_USERNAME in players
-        runner.run_test(test_name, lambda: in_list, True,
-                       f"Admin in list: {in_list}")
+        runner.run_test_bool(test_name, in_list, True,
+                            f"Admin in list: {in_list}")
     
     runner.print_summary()
     return runner
@@ -901,8 +1148,8 @@ def test_admin_can_remove_any_player():
     # Test 1: Admin SHOULD be able to remove any user
     test_name = f"Admin should be able to remove '{NORMAL_USER_USERNAME}'"
     success, message = unregister_player(ADMIN_USERNAME, NORMAL_USER_USERNAME)
-    runner.run_test(test_name, lambda: success, True,
-                   f"Removal: {message if not success else 'Success'}")
+    runner.run_test_bool(test_name, success, True,
+                        f"Removal: {message if not success else 'Success'}")
     
     if success:
         # Test 2: User should be removed from list
@@ -911,10 +1158,10 @@ def test_admin_can_remove_any_player():
         if slot:
             players = slot.get("players", [])
             not_in_list = NORMAL_USER_USERNAME not in players
-            runner.run_test(test_name, lambda: not_in_list, True,
-                           f"Removed: {not_in_list}")
+            runner.run_test_bool(test_name, not_in_list, True,
+                                f"Removed: {not_in_list}")
         else:
-            runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+            runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
     
     runner.print_summary()
     return runner
@@ -925,28 +1172,82 @@ def test_admin_guest_management():
     print_test_header("ADMIN USER - GUEST MANAGEMENT TESTS")
     runner = TestRunner("Admin Guest Management")
     
-    guest_name = f"AdminGuest_{random.randint(1000, 9999)}"
+    guest_name = unique_guest("AdminGuest")
     
     # Test 1: Admin can register guests
     test_name = f"Admin should be able to register guest '{guest_name}'"
     success, message, data = register_guest(ADMIN_USERNAME, guest_name)
-    runner.run_test(test_name, lambda: success, True,
-                   f"Guest registration: {message if not success else 'Success'}")
+    runner.run_test_bool(test_name, success, True,
+                        f"Guest registration: {message if not success else 'Success'}")
     
     if success and data:
         # Test 2: Admin can remove any guest (including those invited by others)
         test_name = "Admin should be able to remove any guest"
         
         # Find the guest entry in the players list
-        players = data.get("players", [])
-        guest_entry = next((p for p in players if guest_name in p), None)
+        guest_entry = index_players(data).get(guest_name)
         
         if guest_entry:
             success_remove, message_remove = unregister_player(ADMIN_USERNAME, guest_entry)
-            runner.run_test(test_name, lambda: success_remove, True,
-                           f"Guest removal: {message_remove if not success_remove else 'Success'}")
+            runner.run_test_bool(test_name, success_remove, True,
+                                f"Guest removal: {message_remove if not success_remove else 'Success'}")
         else:
-            runner.run_test(test_name, lambda: False, True, "Guest not found in list")
+            runner.run_test_bool(test_name, False, True, "Guest not found in list")
+    
+    runner.print_summary()
+    return runner
+
+
+def test_bulk_unregistration():
+    """Test the bulk unregistration endpoint directly (no per-player fallback)"""
+    print_test_header("BULK UNREGISTRATION TESTS")
+    runner = TestRunner("Bulk Unregistration")
+    
+    # Setup: user2 registered plus two guests invited by user1
+    ensure_unregistered(NORMAL_USER2_USERNAME)
+    guest_names = [unique_guest("BulkGuest") for _ in range(2)]
+    success_reg, msg_reg, _ = register_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)
+    guest_results = register_guests(NORMAL_USER_USERNAME, guest_names)
+    entries_by_name = index_players(get_current_slot(force=True))
+    entries = [entries_by_name.get(n) for n in [NORMAL_USER2_USERNAME] + guest_names]
+    
+    if not (success_reg and all(ok for ok, _, _ in guest_results) and all(entries)):
+        runner.run_test_bool("Setup: register user and guests for bulk removal", False, True,
+                            f"Registration: {msg_reg}, guests: {[m for _, m, _ in guest_results]}")
+        runner.print_summary()
+        return runner
+    
+    # Test 1: Normal user listing someone else's entry is refused as a whole
+    test_name = f"'{NORMAL_USER_USERNAME}' bulk removal including '{NORMAL_USER2_USERNAME}' returns 403"
+    status = post_bulk_unregister(NORMAL_USER_USERNAME, entries)
+    runner.run_test_bool(test_name, status, 403, f"Status: {status}")
+    
+    test_name = "Refused bulk removal leaves every entry in the slot"
+    players = set((get_current_slot(force=True) or {}).get("players", ()))
+    missing = [e for e in entries if e not in players]
+    runner.run_test_bool(test_name, not missing, True,
+                        f"Missing: {missing}" if missing else "All entries still registered")
+    
+    # Test 2: Only unknown names
+    test_name = "Bulk removal of unknown names returns 404"
+    status = post_bulk_unregister(ADMIN_USERNAME, ["NoSuchPlayer_Bulk", "(Invité) NoSuchGuest_Bulk [par nobody]"])
+    runner.run_test_bool(test_name, status, 404, f"Status: {status}")
+    
+    # Test 3: Empty list fails validation
+    test_name = "Bulk removal with an empty list returns 422"
+    status = post_bulk_unregister(ADMIN_USERNAME, [])
+    runner.run_test_bool(test_name, status, 422, f"Status: {status}")
+    
+    # Test 4: Admin removes the player and both guests in one call
+    test_name = "Admin bulk removal of a player and guests returns 200"
+    status = post_bulk_unregister(ADMIN_USERNAME, entries)
+    runner.run_test_bool(test_name, status, 200, f"Status: {status}")
+    
+    test_name = "Bulk-removed entries are gone from the slot"
+    players = set((get_current_slot(force=True) or {}).get("players", ()))
+    remaining = [e for e in entries if e in players]
+    runner.run_test_bool(test_name, not remaining, True,
+                        f"Still registered: {remaining}" if remaining else "All entries removed")
     
     runner.print_summary()
     return runner
@@ -965,72 +1266,71 @@ def test_complete_user_journey():
     journey_pin = NORMAL_USER2_PIN
     
     # Pre-step: Unregister if already registered
-    unregister_player(journey_user, journey_user)
-    time.sleep(0.3)
+    ensure_unregistered(journey_user)
     
     # Step 1: Login
     test_name = f"Step 1: User '{journey_user}' logs in"
     success_login, user_data = login(journey_user, journey_pin)
-    runner.run_test(test_name, lambda: success_login, True,
-                   f"Login: {'Success' if success_login else 'Failed'}")
+    runner.run_test_bool(test_name, success_login, True,
+                        f"Login: {'Success' if success_login else 'Failed'}")
     
     if success_login:
         # Step 2: Check current slot
         test_name = "Step 2: User views current slot"
         slot = get_current_slot()
-        runner.run_test(test_name, lambda: slot is not None, True,
-                       f"Slot date: {slot.get('date') if slot else 'N/A'}")
+        runner.run_test_bool(test_name, slot is not None, True,
+                            f"Slot date: {slot.get('date') if slot else 'N/A'}")
         
         # Step 3: Register for slot
         test_name = "Step 3: User registers for slot"
         success_reg, msg_reg, data_reg = register_player(journey_user, journey_user)
-        runner.run_test(test_name, lambda: success_reg, True,
-                       f"Registration: {msg_reg if not success_reg else 'Success'}")
+        runner.run_test_bool(test_name, success_reg, True,
+                            f"Registration: {msg_reg if not success_reg else 'Success'}")
         
         if success_reg:
             # Step 4: Verify registration
             test_name = "Step 4: User appears in slot"
             slot_after = get_current_slot()
             in_slot = journey_user in slot_after.get("players", []) if slot_after else False
-            runner.run_test(test_name, lambda: in_slot, True,
-                           f"In slot: {in_slot}")
+            runner.run_test_bool(test_name, in_slot, True,
+                                f"In slot: {in_slot}")
             
             # Step 5: Register a guest
-            guest_name = f"Journey_Guest_{random.randint(100, 999)}"
+            guest_name = unique_guest("Journey_Guest")
             test_name = f"Step 5: User registers guest '{guest_name}'"
             success_guest, msg_guest, data_guest = register_guest(journey_user, guest_name)
-            runner.run_test(test_name, lambda: success_guest, True,
-                           f"Guest: {msg_guest if not success_guest else 'Success'}")
+            runner.run_test_bool(test_name, success_guest, True,
+                                f"Guest: {msg_guest if not success_guest else 'Success'}")
             
             # Step 6: Verify guest appears
             if success_guest:
                 test_name = "Step 6: Guest appears in slot"
                 slot_with_guest = get_current_slot()
-                guest_in_slot = any(guest_name in p for p in slot_with_guest.get("players", [])) if slot_with_guest else False
-                runner.run_test(test_name, lambda: guest_in_slot, True,
-                               f"Guest in slot: {guest_in_slot}")
+                guest_entry = index_players(slot_with_guest).get(guest_name)
+                guest_in_slot = guest_entry is not None
+                runner.run_test_bool(test_name, guest_in_slot, True,
+                                    f"Guest in slot: {guest_in_slot}")
                 
                 # Step 7: Remove guest
                 if guest_in_slot:
-                    guest_entry = next((p for p in slot_with_guest.get("players", []) if guest_name in p), None)
                     test_name = "Step 7: User removes their guest"
                     success_remove_guest, msg_remove_guest = unregister_player(journey_user, guest_entry)
-                    runner.run_test(test_name, lambda: success_remove_guest, True,
-                                   f"Guest removal: {msg_remove_guest if not success_remove_guest else 'Success'}")
+                    runner.run_test_bool(test_name, success_remove_guest, True,
+                                        f"Guest removal: {msg_remove_guest if not success_remove_guest else 'Success'}")
             
             # Step 8: Unregister self
             test_name = "Step 8: User unregisters themselves"
             success_unreg, msg_unreg = unregister_player(journey_user, journey_user)
-            runner.run_test(test_name, lambda: success_unreg, True,
-                           f"Unregistration: {msg_unreg if not success_unreg else 'Success'}")
+            runner.run_test_bool(test_name, success_unreg, True,
+                                f"Unregistration: {msg_unreg if not success_unreg else 'Success'}")
             
             # Step 9: Verify unregistration
             if success_unreg:
                 test_name = "Step 9: User no longer appears in slot"
                 final_slot = get_current_slot()
                 not_in_slot = journey_user not in final_slot.get("players", []) if final_slot else True
-                runner.run_test(test_name, lambda: not_in_slot, True,
-                               f"Removed: {not_in_slot}")
+                runner.run_test_bool(test_name, not_in_slot, True,
+                                    f"Removed: {not_in_slot}")
     
     runner.print_summary()
     return runner
@@ -1042,22 +1342,26 @@ def test_multi_user_interactions():
     print_test_header("MULTI-USER INTERACTION TESTS")
     runner = TestRunner("Multi-User Interactions")
     
+    both_users = {NORMAL_USER_USERNAME, NORMAL_USER2_USERNAME}
+    
     # Ensure both users are not registered initially
-    unregister_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    unregister_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)
-    time.sleep(0.5)
+    ensure_unregistered(NORMAL_USER_USERNAME, NORMAL_USER2_USERNAME)
+    
+    # Both users register concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future1 = executor.submit(register_player, NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
+        future2 = executor.submit(register_player, NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)
+        (success1, _, data1), (success2, _, data2) = future1.result(), future2.result()
     
     # Test 1: First user registers
     test_name = f"User 1 '{NORMAL_USER_USERNAME}' registers"
-    success1, _, data1 = register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    runner.run_test(test_name, lambda: success1, True,
-                   f"User 1 registered: {success1}")
+    runner.run_test_bool(test_name, success1, True,
+                        f"User 1 registered: {success1}")
     
     # Test 2: Second user registers
     test_name = f"User 2 '{NORMAL_USER2_USERNAME}' registers"
-    success2, _, data2 = register_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)
-    runner.run_test(test_name, lambda: success2, True,
-                   f"User 2 registered: {success2}")
+    runner.run_test_bool(test_name, success2, True,
+                        f"User 2 registered: {success2}")
     
     if success1 and success2:
         # Test 3: Both users should appear in slot
@@ -1065,23 +1369,24 @@ def test_multi_user_interactions():
         slot = get_current_slot()
         if slot:
             players = slot.get("players", [])
-            both_present = NORMAL_USER_USERNAME in players and NORMAL_USER2_USERNAME in players
-            runner.run_test(test_name, lambda: both_present, True,
-                           f"Players: {players}")
+            player_set = set(players)
+            both_present = both_users <= player_set
+            runner.run_test_bool(test_name, both_present, True,
+                                f"Players: {players}")
         else:
-            runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+            runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
         
         # Test 4: User 1 cannot remove User 2
         test_name = "User 1 should NOT be able to remove User 2"
         success_remove, msg = unregister_player(NORMAL_USER_USERNAME, NORMAL_USER2_USERNAME)
-        runner.run_test(test_name, lambda: not success_remove, True,
-                       f"Blocked: {msg}")
+        runner.run_test_bool(test_name, not success_remove, True,
+                            f"Blocked: {msg}")
         
         # Test 5: User 2 can remove themselves
         test_name = "User 2 can remove themselves"
         success_self_remove, _ = unregister_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)
-        runner.run_test(test_name, lambda: success_self_remove, True,
-                       f"Self removal: {success_self_remove}")
+        runner.run_test_bool(test_name, success_self_remove, True,
+                            f"Self removal: {success_self_remove}")
     
     runner.print_summary()
     return runner
@@ -1101,22 +1406,21 @@ def test_progressive_slot_filling():
     
     if slot and initial_count > 0:
         # Try to remove all players using admin account
-        players = slot.get("players", [])
-        for player in players:
-            unregister_player(ADMIN_USERNAME, player)
-        time.sleep(0.5)
-        slot = get_current_slot()
-        cleared = slot.get("player_count", 0) == 0 if slot else False
-        runner.run_test(test_name, lambda: cleared, True,
-                       f"Initial: {initial_count}, After clear: {slot.get('player_count', 0) if slot else 'N/A'}")
+        players = slot.get("players", ())
+        unregister_players(ADMIN_USERNAME, players)
+        slot = wait_for_version_change(slot_version(slot))
+        count_after_clear = slot.get("player_count", 0) if slot else 'N/A'
+        cleared = count_after_clear == 0
+        runner.run_test_bool(test_name, cleared, True,
+                            f"Initial: {initial_count}, After clear: {count_after_clear}")
     else:
-        runner.run_test(test_name, lambda: True, True,
-                       f"Slot already empty")
+        runner.run_test_bool(test_name, True, True,
+                            f"Slot already empty")
     
     # Get fresh slot state
     slot = get_current_slot()
     if not slot:
-        runner.run_test("Could not retrieve slot", lambda: False, True, "Aborting progressive fill tests")
+        runner.run_test_bool("Could not retrieve slot", False, True, "Aborting progressive fill tests")
         runner.print_summary()
         return runner
     
@@ -1124,62 +1428,58 @@ def test_progressive_slot_filling():
     test_name = "Step 2: Slot accepts 1st player (0 → 1)"
     success1, _, data1 = register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
     count_after_1 = data1.get("player_count", 0) if data1 else 0
-    runner.run_test(test_name, lambda: success1 and count_after_1 == 1, True,
-                   f"Success: {success1}, Count: {count_after_1}/10")
+    runner.run_test_bool(test_name, success1 and count_after_1 == 1, True,
+                        f"Success: {success1}, Count: {count_after_1}/10")
     
     # Step 3: Register second user (1 → 2)
     test_name = "Step 3: Slot accepts 2nd player (1 → 2)"
     success2, _, data2 = register_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)
     count_after_2 = data2.get("player_count", 0) if data2 else 0
-    runner.run_test(test_name, lambda: success2 and count_after_2 == 2, True,
-                   f"Success: {success2}, Count: {count_after_2}/10")
-    time.sleep(0.2)
+    runner.run_test_bool(test_name, success2 and count_after_2 == 2, True,
+                        f"Success: {success2}, Count: {count_after_2}/10")
     
     # Step 4: Register admin user (2 → 3)
     test_name = "Step 4: Slot accepts 3rd player (2 → 3)"
     success3, _, data3 = register_player(ADMIN_USERNAME, ADMIN_USERNAME)
     count_after_3 = data3.get("player_count", 0) if data3 else 0
-    runner.run_test(test_name, lambda: success3 and count_after_3 == 3, True,
-                   f"Success: {success3}, Count: {count_after_3}/10")
-    time.sleep(0.2)
+    runner.run_test_bool(test_name, success3 and count_after_3 == 3, True,
+                        f"Success: {success3}, Count: {count_after_3}/10")
     
     # Step 5-11: Fill remaining slots with guests (3 → 10)
     for i in range(4, 11):
         test_name = f"Step {i+1}: Slot accepts player {i} via guest ({i-1} → {i})"
-        guest_name = f"Guest_{i}_{random.randint(100,999)}"
+        guest_name = unique_guest(f"Guest_{i}")
         success, _, data = register_guest(NORMAL_USER_USERNAME, guest_name)
         count = data.get("player_count", 0) if data else 0
-        runner.run_test(test_name, lambda s=success, c=count, expected=i: s and c == expected, True,
-                       f"Success: {success}, Count: {count}/10")
-        time.sleep(0.2)  # Small delay between registrations
+        runner.run_test_bool(test_name, success and count == i, True,
+                            f"Success: {success}, Count: {count}/10")
     
     # Verify slot is now full
-    slot_full = get_current_slot()
-    final_count = slot_full.get("player_count", 0) if slot_full else 0
+    final_count = get_player_count()
     
     # Step 12: Verify slot is full (count = 10)
     test_name = "Step 12: Verify slot is exactly full (10/10)"
-    runner.run_test(test_name, lambda: final_count == 10, True,
-                   f"Final count: {final_count}/10")
+    runner.run_test_bool(test_name, final_count == 10, True,
+                        f"Final count: {final_count}/10")
     
     # Step 13: Test slot rejects 11th guest when full
     test_name = "Step 13: Slot rejects 11th guest when full"
-    success_11, message_11, _ = register_guest(NORMAL_USER_USERNAME, f"Guest_11_{random.randint(100,999)}")
-    runner.run_test(test_name, lambda: not success_11, True,
-                   f"Rejected: {message_11}")
+    success_11, message_11, _ = register_guest(NORMAL_USER_USERNAME, unique_guest("Guest_11"))
+    runner.run_test_bool(test_name, not success_11, True,
+                        f"Rejected: {message_11}")
     
     # Step 14: Verify rejection message mentions "full" or "complet"
     test_name = "Step 14: Rejection message indicates slot is full"
-    has_full_message = "complet" in message_11.lower() or "full" in message_11.lower()
-    runner.run_test(test_name, lambda: has_full_message, True,
-                   f"Message: {message_11}")
+    has_full_message = bool(SLOT_FULL_RE.search(message_11))
+    runner.run_test_bool(test_name, has_full_message, True,
+                        f"Message: {message_11}")
     
     # Step 15: Count should still be 10 after rejection
     test_name = "Step 15: Player count remains 10 after rejection"
     slot_after_reject = get_current_slot()
     count_after_reject = slot_after_reject.get("player_count", 0) if slot_after_reject else 0
-    runner.run_test(test_name, lambda: count_after_reject == 10, True,
-                   f"Count: {count_after_reject}/10")
+    runner.run_test_bool(test_name, count_after_reject == 10, True,
+                        f"Count: {count_after_reject}/10")
     
     # Step 16: Remove one player to free a spot
     test_name = "Step 16: Remove one player (10 → 9)"
@@ -1188,41 +1488,45 @@ def test_progressive_slot_filling():
         if players:
             player_to_remove = players[0]  # Remove first player
             success_remove, _ = unregister_player(ADMIN_USERNAME, player_to_remove)
-            time.sleep(0.3)
-            slot_after_remove = get_current_slot()
+            slot_after_remove = wait_for_version_change(slot_version(slot_after_reject))
             count_after_remove = slot_after_remove.get("player_count", 0) if slot_after_remove else 0
-            runner.run_test(test_name, lambda: success_remove and count_after_remove == 9, True,
-                           f"Removed: {success_remove}, Count: {count_after_remove}/10")
+            runner.run_test_bool(test_name, success_remove and count_after_remove == 9, True,
+                                f"Removed: {success_remove}, Count: {count_after_remove}/10")
         else:
-            runner.run_test(test_name, lambda: False, True, "No players to remove")
+            runner.run_test_bool(test_name, False, True, "No players to remove")
     
     # Step 17: Slot should accept new guest after spot freed (9 → 10)
     test_name = "Step 17: Slot accepts guest after spot freed (9 → 10)"
-    success_refill, _, data_refill = register_guest(NORMAL_USER_USERNAME, f"Guest_Refill_{random.randint(100,999)}")
+    success_refill, _, data_refill = register_guest(NORMAL_USER_USERNAME, unique_guest("Guest_Refill"))
     count_refill = data_refill.get("player_count", 0) if data_refill else 0
-    runner.run_test(test_name, lambda: success_refill and count_refill == 10, True,
-                   f"Success: {success_refill}, Count: {count_refill}/10")
+    runner.run_test_bool(test_name, success_refill and count_refill == 10, True,
+                        f"Success: {success_refill}, Count: {count_refill}/10")
     
     # Step 18: Slot should be full again
     test_name = "Step 18: Slot is full again after refill"
-    slot_final = get_current_slot()
-    final_count_2 = slot_final.get("player_count", 0) if slot_final else 0
-    runner.run_test(test_name, lambda: final_count_2 == 10, True,
-                   f"Final count: {final_count_2}/10")
+    final_count_2 = get_player_count()
+    runner.run_test_bool(test_name, final_count_2 == 10, True,
+                        f"Final count: {final_count_2}/10")
     
     runner.print_summary()
     return runner
 
 
 def test_full_slot_behavior():
-    """Test various operations when slot is full"""
+    """
+    Test various operations when slot is full.
+    
+    Intentionally shares state with test_progressive_slot_filling: when run
+    right after it (as main() does), the slot is already 10/10 and the fill
+    phase below is skipped.
+    """
     print_test_header("FULL SLOT BEHAVIOR TESTS")
     runner = TestRunner("Full Slot Behavior")
     
-    # Ensure slot is full first
+    # Ensure slot is full first (no-op when the previous suite left it full)
     slot = get_current_slot()
     if not slot:
-        runner.run_test("Could not retrieve slot", lambda: False, True, "Aborting full slot tests")
+        runner.run_test_bool("Could not retrieve slot", False, True, "Aborting full slot tests")
         runner.print_summary()
         return runner
     
@@ -1232,84 +1536,70 @@ def test_full_slot_behavior():
     if current_count < 10:
         print(f"{Colors.YELLOW}Filling slot to capacity with guests...{Colors.RESET}")
         spots_needed = 10 - current_count
-        for i in range(spots_needed):
-            register_guest(NORMAL_USER_USERNAME, f"FillGuest_{i}_{random.randint(100,999)}")
-            time.sleep(0.2)
-        slot = get_current_slot()
-        current_count = slot.get("player_count", 0) if slot else 0
+        register_guests(NORMAL_USER_USERNAME, [unique_guest(f"FillGuest_{i}") for i in range(spots_needed)])
+        current_count = get_player_count()
     
     # Test 1: Verify slot is full
     test_name = "Verify slot is at maximum capacity (10/10)"
-    runner.run_test(test_name, lambda: current_count == 10, True,
-                   f"Current count: {current_count}/10")
-    
-    # Test 2: Guest registration should fail when full
-    test_name = "Guest registration should fail when full"
-    success2, msg2, _ = register_guest(NORMAL_USER_USERNAME, f"NewGuest_{random.randint(1000,9999)}")
-    runner.run_test(test_name, lambda: not success2, True,
-                   f"Blocked: {msg2}")
-    
-    # Test 3: Another guest registration should also fail when full
-    test_name = "Another guest registration should fail when full"
-    success3, msg3, _ = register_guest(NORMAL_USER2_USERNAME, f"AnotherGuest_{random.randint(1000,9999)}")
-    runner.run_test(test_name, lambda: not success3, True,
-                   f"Blocked: {msg3}")
-    
-    # Test 4: Multiple guest registration attempts should all fail
-    test_name = "Multiple rapid guest registration attempts should all fail"
-    attempts = []
-    for i in range(3):
-        success, _, _ = register_guest(NORMAL_USER_USERNAME, f"GuestAttempt_{i}_{random.randint(1000,9999)}")
-        attempts.append(success)
-        time.sleep(0.1)
-    all_failed = all(not s for s in attempts)
-    runner.run_test(test_name, lambda: all_failed, True,
-                   f"All 3 attempts failed: {all_failed}")
+    runner.run_test_bool(test_name, current_count == 10, True,
+                        f"Current count: {current_count}/10")
+    
+    # Tests 2-4: Guest registrations from both users should all fail when full (probed concurrently)
+    test_name = "Guest registrations should all fail when full (5 concurrent attempts)"
+    attempts = [
+        (NORMAL_USER_USERNAME, unique_guest("NewGuest")),
+        (NORMAL_USER2_USERNAME, unique_guest("AnotherGuest")),
+    ] + [(NORMAL_USER_USERNAME, unique_guest(f"GuestAttempt_{i}")) for i in range(3)]
+    with ThreadPoolExecutor(max_workers=len(attempts)) as executor:
+        results = list(executor.map(lambda attempt: register_guest(*attempt), attempts))
+    all_failed = all(not success for success, _, _ in results)
+    runner.run_test_bool(test_name, all_failed, True,
+                        "; ".join(f"{guest}: {'accepted' if success else msg}"
+                                  for (_, guest), (success, msg, _) in zip(attempts, results)))
     
     # Test 6: Slot data retrieval still works when full
     test_name = "Slot data retrieval works when full"
     slot_data = get_current_slot()
     retrieval_works = slot_data is not None
-    runner.run_test(test_name, lambda: retrieval_works, True,
-                   f"Data retrieved: {retrieval_works}")
+    runner.run_test_bool(test_name, retrieval_works, True,
+                        f"Data retrieved: {retrieval_works}")
     
     # Test 7: Players list has exactly 10 entries
     test_name = "Players list contains exactly 10 entries"
+    players = slot_data.get("players", ()) if slot_data else ()
     if slot_data:
-        players_list = slot_data.get("players", [])
-        has_10 = len(players_list) == 10
-        runner.run_test(test_name, lambda: has_10, True,
-                       f"List length: {len(players_list)}")
+        players_length = len(players)
+        has_10 = players_length == 10
+        runner.run_test_bool(test_name, has_10, True,
+                            f"List length: {players_length}")
     else:
-        runner.run_test(test_name, lambda: False, True, "No slot data")
+        runner.run_test_bool(test_name, False, True, "No slot data")
     
     # Test 8: Admin can still remove players when full
     test_name = "Admin can remove player even when slot is full"
     if slot_data:
-        players = slot_data.get("players", [])
         if players:
             success_admin_remove, _ = unregister_player(ADMIN_USERNAME, players[0])
-            runner.run_test(test_name, lambda: success_admin_remove, True,
-                           f"Admin removal: {success_admin_remove}")
+            runner.run_test_bool(test_name, success_admin_remove, True,
+                                f"Admin removal: {success_admin_remove}")
             
             # Test 9: Spot should be available after admin removal
             if success_admin_remove:
-                time.sleep(0.3)
                 test_name = "Spot available after admin removes player"
-                slot_after = get_current_slot()
+                slot_after = wait_for_version_change(slot_version(slot_data))
                 count_after = slot_after.get("player_count", 0) if slot_after else 0
-                runner.run_test(test_name, lambda: count_after == 9, True,
-                               f"Count after removal: {count_after}/10")
+                runner.run_test_bool(test_name, count_after == 9, True,
+                                    f"Count after removal: {count_after}/10")
                 
                 # Test 10: New guest registration should succeed after spot freed
                 test_name = "New guest registration succeeds after spot freed"
-                success_new, _, _ = register_guest(NORMAL_USER_USERNAME, f"GuestAfterRemoval_{random.randint(1000,9999)}")
-                runner.run_test(test_name, lambda: success_new, True,
-                               f"Registration: {success_new}")
+                success_new, _, _ = register_guest(NORMAL_USER_USERNAME, unique_guest("GuestAfterRemoval"))
+                runner.run_test_bool(test_name, success_new, True,
+                                    f"Registration: {success_new}")
         else:
-            runner.run_test(test_name, lambda: False, True, "No players to remove")
+            runner.run_test_bool(test_name, False, True, "No players to remove")
     else:
-        runner.run_test(test_name, lambda: False, True, "No slot data")
+        runner.run_test_bool(test_name, False, True, "No slot data")
     
     runner.print_summary()
     return runner
@@ -1320,50 +1610,49 @@ def test_guest_permission_boundaries():
     print_test_header("GUEST PERMISSION BOUNDARY TESTS")
     runner = TestRunner("Guest Permission Boundaries")
     
-    guest1_name = f"User1Guest_{random.randint(1000, 9999)}"
-    guest2_name = f"User2Guest_{random.randint(1000, 9999)}"
+    guest1_name = unique_guest("User1Guest")
+    guest2_name = unique_guest("User2Guest")
     
     # Setup: Register two guests by different users
     register_guest(NORMAL_USER_USERNAME, guest1_name)
     register_guest(NORMAL_USER2_USERNAME, guest2_name)
-    time.sleep(0.3)
     
     slot = get_current_slot()
     if not slot:
-        runner.run_test("Could not retrieve slot", lambda: False, True, "Aborting guest permission tests")
+        runner.run_test_bool("Could not retrieve slot", False, True, "Aborting guest permission tests")
         runner.print_summary()
         return runner
     
-    players = slot.get("players", [])
-    guest1_entry = next((p for p in players if guest1_name in p), None)
-    guest2_entry = next((p for p in players if guest2_name in p), None)
+    guest_index = index_players(slot)
+    guest1_entry = guest_index.get(guest1_name)
+    guest2_entry = guest_index.get(guest2_name)
     
     # Test 1: User can remove their own guest
     test_name = f"User 1 can remove their own guest '{guest1_name}'"
     if guest1_entry:
         success1, msg1 = unregister_player(NORMAL_USER_USERNAME, guest1_entry)
-        runner.run_test(test_name, lambda: success1, True,
-                       f"Removal: {msg1 if not success1 else 'Success'}")
+        runner.run_test_bool(test_name, success1, True,
+                            f"Removal: {msg1 if not success1 else 'Success'}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Guest 1 not found")
+        runner.run_test_bool(test_name, False, True, "Guest 1 not found")
     
     # Test 2: User cannot remove another user's guest
     test_name = f"User 1 cannot remove User 2's guest '{guest2_name}'"
     if guest2_entry:
         success2, msg2 = unregister_player(NORMAL_USER_USERNAME, guest2_entry)
-        runner.run_test(test_name, lambda: not success2, True,
-                       f"Blocked: {msg2}")
+        runner.run_test_bool(test_name, not success2, True,
+                            f"Blocked: {msg2}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Guest 2 not found")
+        runner.run_test_bool(test_name, False, True, "Guest 2 not found")
     
     # Test 3: Admin can remove any guest
     test_name = f"Admin can remove any user's guest"
     if guest2_entry:
         success3, msg3 = unregister_player(ADMIN_USERNAME, guest2_entry)
-        runner.run_test(test_name, lambda: success3, True,
-                       f"Admin removal: {msg3 if not success3 else 'Success'}")
+        runner.run_test_bool(test_name, success3, True,
+                            f"Admin removal: {msg3 if not success3 else 'Success'}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Guest 2 not found")
+        runner.run_test_bool(test_name, False, True, "Guest 2 not found")
     
     runner.print_summary()
     return runner
@@ -1378,52 +1667,50 @@ def test_timestamp_validation():
     slot = get_current_slot()
     if slot:
         players = slot.get("players", [])
-        for player in players:
-            unregister_player(ADMIN_USERNAME, player)
-    time.sleep(0.5)
+        unregister_players(ADMIN_USERNAME, players)
     
     # Register a player
     register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    time.sleep(0.3)
     
     slot = get_current_slot()
     if not slot:
-        runner.run_test("Could not retrieve slot", lambda: False, True, "Aborting timestamp tests")
+        runner.run_test_bool("Could not retrieve slot", False, True, "Aborting timestamp tests")
         runner.print_summary()
         return runner
     
     # Test 1: Response should have timestamps field
     test_name = "Slot response should contain 'timestamps' field"
     has_timestamps = "timestamps" in slot
-    runner.run_test(test_name, lambda: has_timestamps, True,
-                   f"Has timestamps: {has_timestamps}")
+    runner.run_test_bool(test_name, has_timestamps, True,
+                        f"Has timestamps: {has_timestamps}")
     
     if has_timestamps:
         timestamps = slot.get("timestamps", [])
         
         # Test 2: Timestamps should be a list
         test_name = "Timestamps should be a list"
-        runner.run_test(test_name, lambda: isinstance(timestamps, list), True,
-                       f"Type: {type(timestamps)}")
+        runner.run_test_bool(test_name, isinstance(timestamps, list), True,
+                            f"Type: {type(timestamps)}")
         
         # Test 3: Timestamps count should match player count
         test_name = "Timestamps count should match player count"
         player_count = slot.get("player_count", 0)
         timestamp_count = len(timestamps)
-        runner.run_test(test_name, lambda: timestamp_count == player_count, True,
-                       f"Players: {player_count}, Timestamps: {timestamp_count}")
+        runner.run_test_bool(test_name, timestamp_count == player_count, True,
+                            f"Players: {player_count}, Timestamps: {timestamp_count}")
         
         # Test 4: Each timestamp should be valid ISO format
         if timestamps:
             test_name = "All timestamps should be valid ISO 8601 format"
             try:
-                for ts in timestamps:
-                    datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                runner.run_test(test_name, lambda: True, True,
-                               f"All {len(timestamps)} timestamps valid")
+                all_valid = all(ISO_RE.match(ts) for ts in timestamps)
+                # Sanity check: the regex must agree with the real parser
+                datetime.fromisoformat(timestamps[0].replace('Z', '+00:00'))
+                runner.run_test_bool(test_name, all_valid, True,
+                                    f"All {len(timestamps)} timestamps valid" if all_valid else "Invalid timestamp format found")
             except:
-                runner.run_test(test_name, lambda: False, True,
-                               f"Invalid timestamp format found")
+                runner.run_test_bool(test_name, False, True,
+                                    f"Invalid timestamp format found")
     
     runner.print_summary()
     return runner
@@ -1437,53 +1724,51 @@ def test_data_consistency():
     # Test 1: Player count always matches list length
     test_name = "Player count field always matches actual list length"
     slot = get_current_slot()
+    players = slot.get("players", ()) if slot else ()
     if slot:
         player_count = slot.get("player_count", 0)
-        players_length = len(slot.get("players", []))
-        runner.run_test(test_name, lambda: player_count == players_length, True,
-                       f"Count: {player_count}, Length: {players_length}")
+        players_length = len(players)
+        runner.run_test_bool(test_name, player_count == players_length, True,
+                            f"Count: {player_count}, Length: {players_length}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+        runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
     
     # Test 2: No duplicate players in list
     test_name = "No duplicate players in players list"
     if slot:
-        players = slot.get("players", [])
-        unique_players = list(set(players))
-        has_no_duplicates = len(players) == len(unique_players)
-        runner.run_test(test_name, lambda: has_no_duplicates, True,
-                       f"Players: {len(players)}, Unique: {len(unique_players)}")
+        unique_count = len(set(players))
+        has_no_duplicates = len(players) == unique_count
+        runner.run_test_bool(test_name, has_no_duplicates, True,
+                            f"Players: {len(players)}, Unique: {unique_count}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+        runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
     
     # Test 3: Register and immediately check consistency
     test_name = "Consistency maintained after registration"
-    unregister_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    time.sleep(0.3)
+    ensure_unregistered(NORMAL_USER_USERNAME)
     success, _, data = register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
     if success and data:
         count = data.get("player_count", 0)
         length = len(data.get("players", []))
         consistent = count == length
-        runner.run_test(test_name, lambda: consistent, True,
-                       f"After registration - Count: {count}, Length: {length}")
+        runner.run_test_bool(test_name, consistent, True,
+                            f"After registration - Count: {count}, Length: {length}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Registration failed")
+        runner.run_test_bool(test_name, False, True, "Registration failed")
     
     # Test 4: Consistency after unregistration
     test_name = "Consistency maintained after unregistration"
     success_unreg, _ = unregister_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
     if success_unreg:
-        time.sleep(0.3)
-        slot_after = get_current_slot()
+        slot_after = wait_for_version_change(slot_version(data))
         if slot_after:
             count_after = slot_after.get("player_count", 0)
             length_after = len(slot_after.get("players", []))
             consistent_after = count_after == length_after
-            runner.run_test(test_name, lambda: consistent_after, True,
-                           f"After unregistration - Count: {count_after}, Length: {length_after}")
+            runner.run_test_bool(test_name, consistent_after, True,
+                                f"After unregistration - Count: {count_after}, Length: {length_after}")
         else:
-            runner.run_test(test_name, lambda: False, True, "Could not retrieve slot")
+            runner.run_test_bool(test_name, False, True, "Could not retrieve slot")
     
     runner.print_summary()
     return runner
@@ -1497,7 +1782,7 @@ def test_boundary_conditions():
     # Get current state
     slot = get_current_slot()
     if not slot:
-        runner.run_test("Could not retrieve slot", lambda: False, True, "Aborting boundary tests")
+        runner.run_test_bool("Could not retrieve slot", False, True, "Aborting boundary tests")
         runner.print_summary()
         return runner
     
@@ -1508,38 +1793,34 @@ def test_boundary_conditions():
         # Fill to 9
         print(f"{Colors.YELLOW}Setting up 9/10 scenario...{Colors.RESET}")
         spots_to_add = 9 - current_count
-        for i in range(spots_to_add):
-            register_guest(NORMAL_USER_USERNAME, f"Boundary_{i}_{random.randint(100,999)}")
-            time.sleep(0.1)
+        register_guests(NORMAL_USER_USERNAME, [unique_guest(f"Boundary_{i}") for i in range(spots_to_add)])
     
     slot = get_current_slot()
     if slot and slot.get("player_count", 0) == 9:
         test_name = "Slot at 9/10 should accept exactly one more player"
-        success, _, data = register_guest(NORMAL_USER_USERNAME, f"FinalSpot_{random.randint(100,999)}")
+        success, _, data = register_guest(NORMAL_USER_USERNAME, unique_guest("FinalSpot"))
         if success and data:
             final_count = data.get("player_count", 0)
-            runner.run_test(test_name, lambda: success and final_count == 10, True,
-                           f"Accepted: {success}, Final count: {final_count}/10")
+            runner.run_test_bool(test_name, success and final_count == 10, True,
+                                f"Accepted: {success}, Final count: {final_count}/10")
         else:
-            runner.run_test(test_name, lambda: False, True, "Failed to add final player")
+            runner.run_test_bool(test_name, False, True, "Failed to add final player")
     
     # Test 2: Empty slot (0/10) accepts first player
     # Clear the slot first
     slot = get_current_slot()
     if slot:
-        players = slot.get("players", [])
-        for player in players:
-            unregister_player(ADMIN_USERNAME, player)
-        time.sleep(0.5)
+        players = slot.get("players", ())
+        unregister_players(ADMIN_USERNAME, players)
     
     test_name = "Empty slot (0/10) accepts first player"
     success_first, _, data_first = register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
     if success_first and data_first:
         count_first = data_first.get("player_count", 0)
-        runner.run_test(test_name, lambda: success_first and count_first == 1, True,
-                       f"First player added: {success_first}, Count: {count_first}/10")
+        runner.run_test_bool(test_name, success_first and count_first == 1, True,
+                            f"First player added: {success_first}, Count: {count_first}/10")
     else:
-        runner.run_test(test_name, lambda: False, True, "Failed to add first player")
+        runner.run_test_bool(test_name, False, True, "Failed to add first player")
     
     # Test 3: Slot with space (< 10) returns correct available spots
     slot = get_current_slot()
@@ -1549,8 +1830,8 @@ def test_boundary_conditions():
         available = max_players - count
         
         test_name = f"Slot with {count}/10 shows {available} available spots"
-        runner.run_test(test_name, lambda: available >= 0, True,
-                       f"Current: {count}/10, Available: {available}")
+        runner.run_test_bool(test_name, available >= 0, True,
+                            f"Current: {count}/10, Available: {available}")
     
     runner.print_summary()
     return runner
@@ -1564,71 +1845,66 @@ def test_error_message_quality():
     # Test 1: Duplicate registration error is in French
     test_name = "Duplicate registration error is in French"
     register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    time.sleep(0.3)
     success, message, _ = register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
     if not success:
-        is_french = any(word in message.lower() for word in ["déjà", "deja", "inscrit"])
-        runner.run_test(test_name, lambda: is_french, True,
-                       f"Message: {message}")
+        is_french = bool(FR_DUP_RE.search(message))
+        runner.run_test_bool(test_name, is_french, True,
+                            f"Message: {message}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Expected error did not occur")
+        runner.run_test_bool(test_name, False, True, "Expected error did not occur")
     
     # Test 2: Full slot error is in French
     test_name = "Full slot error is in French"
-    # Fill slot first
-    slot = get_current_slot()
-    if slot and slot.get("player_count", 0) < 10:
-        spots_needed = 10 - slot.get("player_count", 0)
-        for i in range(spots_needed):
-            register_guest(NORMAL_USER_USERNAME, f"ErrorTest_{i}_{random.randint(100,999)}")
-            time.sleep(0.1)
+    # Fill slot first, unless a previous test already left it full
+    slot = get_current_slot(force=True)
+    player_count = slot.get("player_count", 0) if slot else None
+    if player_count is not None and player_count < 10:
+        register_guests(NORMAL_USER_USERNAME, [unique_guest(f"ErrorTest_{i}") for i in range(10 - player_count)])
     
-    success_full, message_full, _ = register_guest(NORMAL_USER_USERNAME, f"Overflow_{random.randint(1000,9999)}")
+    success_full, message_full, _ = register_guest(NORMAL_USER_USERNAME, unique_guest("Overflow"))
     if not success_full:
-        is_french_full = "complet" in message_full.lower()
-        runner.run_test(test_name, lambda: is_french_full, True,
-                       f"Message: {message_full}")
+        is_french_full = bool(FR_FULL_RE.search(message_full))
+        runner.run_test_bool(test_name, is_french_full, True,
+                            f"Message: {message_full}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Expected error did not occur")
+        runner.run_test_bool(test_name, False, True, "Expected error did not occur")
     
     # Test 3: Authentication error is in French
     test_name = "Authentication error is in French"
     success_auth, message_auth, _ = register_player("fake_user_xyz", "Test")
     if not success_auth:
-        is_french_auth = any(word in message_auth.lower() for word in ["authentification", "requis", "requise"])
-        runner.run_test(test_name, lambda: is_french_auth, True,
-                       f"Message: {message_auth}")
+        is_french_auth = bool(FR_AUTH_RE.search(message_auth))
+        runner.run_test_bool(test_name, is_french_auth, True,
+                            f"Message: {message_auth}")
     else:
-        runner.run_test(test_name, lambda: False, True, "Expected error did not occur")
+        runner.run_test_bool(test_name, False, True, "Expected error did not occur")
     
     # Test 4: Permission error is informative
     test_name = "Permission error mentions inability to remove"
     # Ensure there's space in the slot
     slot_check = get_current_slot()
-    if slot_check and slot_check.get("player_count", 0) >= 10:
+    player_count = slot_check.get("player_count", 0) if slot_check else 0
+    if player_count >= 10:
         # Slot is full, remove one player to make space
-        players = slot_check.get("players", [])
+        players = slot_check.get("players", ())
         if players:
             unregister_player(ADMIN_USERNAME, players[0])
-            time.sleep(0.3)
     
     # Ensure user2 is actually registered and in the slot
-    unregister_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)
-    time.sleep(0.3)
+    ensure_unregistered(NORMAL_USER2_USERNAME)
     success_reg, msg_reg, _ = register_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)
-    time.sleep(0.3)
     
     if success_reg:
         # Now try to remove as different user (should get permission error)
         success_perm, message_perm = unregister_player(NORMAL_USER_USERNAME, NORMAL_USER2_USERNAME)
         if not success_perm:
-            is_informative = any(word in message_perm.lower() for word in ["supprimer", "permission", "pas", "trouvé"])
-            runner.run_test(test_name, lambda: is_informative, True,
-                           f"Message: {message_perm}")
+            is_informative = bool(FR_INFO_RE.search(message_perm))
+            runner.run_test_bool(test_name, is_informative, True,
+                                f"Message: {message_perm}")
         else:
-            runner.run_test(test_name, lambda: False, True, "Expected error did not occur")
+            runner.run_test_bool(test_name, False, True, "Expected error did not occur")
     else:
-        runner.run_test(test_name, lambda: False, True, f"Could not register user: {msg_reg}")
+        runner.run_test_bool(test_name, False, True, f"Could not register user: {msg_reg}")
     
     runner.print_summary()
     return runner
@@ -1642,29 +1918,34 @@ def test_rapid_operations():
     # Test 1: Rapid guest registrations
     test_name = "System handles rapid guest registrations"
     
-    # Check if slot has space before attempting
-    slot = get_current_slot()
-    initial_count = slot.get("player_count", 0) if slot else 0
-    has_space = initial_count < 10
+    # Check if slot has space before attempting (None if the count endpoint failed)
+    initial_count = get_player_count()
+    has_space = initial_count is not None and initial_count < 10
     
-    rapid_guests = []
-    for i in range(3):
-        guest_name = f"Rapid_{i}_{random.randint(1000,9999)}"
-        success, _, _ = register_guest(NORMAL_USER_USERNAME, guest_name)
-        rapid_guests.append(success)
-        # No sleep - as fast as possible
+    # Fire all registrations at once
+    results = register_guests(NORMAL_USER_USERNAME, [unique_guest(f"Rapid_{i}") for i in range(3)])
+    rapid_guests = [success for success, _, _ in results]
     
     # If slot had space, expect registrations to succeed
     # If slot was full, expect registrations to fail (which is OK)
-    if has_space:
+    if initial_count is None:
+        runner.run_test_bool(test_name, False, True, "Could not read the initial player count")
+    elif has_space:
         # At least some should succeed if there was space
         some_succeeded = sum(rapid_guests) > 0
-        runner.run_test(test_name, lambda: some_succeeded, True,
-                       f"Registered: {sum(rapid_guests)}/3 guests (had space: {has_space})")
+        runner.run_test_bool(test_name, some_succeeded, True,
+                            f"Registered: {sum(rapid_guests)}/3 guests (had space: {has_space})")
     else:
         # Slot was full, so failures are expected and acceptable
-        runner.run_test(test_name, lambda: True, True,
-                       f"Slot was full ({initial_count}/10), registrations blocked as expected")
+        runner.run_test_bool(test_name, True, True,
+                            f"Slot was full ({initial_count}/10), registrations blocked as expected")
+    
+    # Concurrent posts near capacity must not push the slot past MAX_PLAYERS
+    test_name = "Concurrent guest registrations never overfill the slot"
+    after_slot = get_current_slot(force=True)
+    final_count = after_slot.get("player_count") if after_slot else None
+    runner.run_test_bool(test_name, final_count is not None and final_count <= MAX_PLAYERS, True,
+                        f"Count after concurrent registrations: {final_count}/{MAX_PLAYERS}")
     
     # Test 2: Register then immediately unregister
     test_name = "Register and immediate unregister works"
@@ -1675,32 +1956,32 @@ def test_rapid_operations():
         # Slot is full, remove one player to make space
         players = slot.get("players", [])
         if players:
-            unregister_player(ADMIN_USERNAME, players[0])
-            time.sleep(0.2)
+            removed, _ = unregister_player(ADMIN_USERNAME, players[0])
+            if removed:
+                wait_until(lambda: not player_in_slot(players[0]))
     
     # Ensure user is not already registered
-    unregister_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    time.sleep(0.2)
+    ensure_unregistered(NORMAL_USER_USERNAME)
     
     success_reg, msg_reg, _ = register_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
-    time.sleep(0.1)  # Small delay between operations
+    if success_reg:
+        wait_until(lambda: player_in_slot(NORMAL_USER_USERNAME))
     success_unreg, msg_unreg = unregister_player(NORMAL_USER_USERNAME, NORMAL_USER_USERNAME)
     
     both_succeeded = success_reg and success_unreg
-    runner.run_test(test_name, lambda: both_succeeded, True,
-                   f"Register: {success_reg}, Unregister: {success_unreg}")
+    runner.run_test_bool(test_name, both_succeeded, True,
+                        f"Register: {success_reg}, Unregister: {success_unreg}")
     
     # Test 3: Multiple API calls to retrieve slot data
     test_name = "Multiple rapid slot retrievals return consistent data"
-    slots = []
-    for i in range(5):
-        slot_data = get_current_slot()
-        if slot_data:
-            slots.append(slot_data.get("player_count", -1))
+    # Concurrent independent reads (bypassing the cache)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        reads = list(executor.map(lambda _: get_current_slot(force=True), range(5)))
+    slots = [slot_data.get("player_count", -1) for slot_data in reads if slot_data]
     
-    all_same = len(set(slots)) == 1 if slots else False
-    runner.run_test(test_name, lambda: all_same, True,
-                   f"Counts: {slots}, All same: {all_same}")
+    all_same = bool(slots) and all(count == slots[0] for count in slots)
+    runner.run_test_bool(test_name, all_same, True,
+                        f"Counts: {slots}, All same: {all_same}")
     
     runner.print_summary()
     return runner
@@ -1719,24 +2000,84 @@ def test_special_characters_in_names():
         ("Müller", "Umlaut"),
     ]
     
+    # Remove all created guests in one batch at the end when the slot has room for all of them;
+    # otherwise remove each one right away so a nearly full slot does not reject later names
+    player_count = get_player_count()
+    defer_cleanup = player_count is not None and MAX_PLAYERS - player_count >= len(special_names)
+    created_entries = []
+    
     for name, description in special_names:
         test_name = f"Guest name with {description}: '{name}'"
-        guest_full_name = f"{name}_{random.randint(100,999)}"
-        success, message, _ = register_guest(NORMAL_USER_USERNAME, guest_full_name)
+        guest_full_name = unique_guest(name)
+        success, message, data = register_guest(NORMAL_USER_USERNAME, guest_full_name)
         
-        # Clean up if successful
-        if success:
-            time.sleep(0.2)
-            slot = get_current_slot()
-            if slot:
-                players = slot.get("players", [])
-                guest_entry = next((p for p in players if name in p), None)
-                if guest_entry:
+        # The registration response already lists the new entry: no extra slot fetch needed
+        if success and data:
+            guest_entry = index_players(data).get(guest_full_name)
+            if guest_entry:
+                if defer_cleanup:
+                    created_entries.append(guest_entry)
+                else:
                     unregister_player(NORMAL_USER_USERNAME, guest_entry)
         
-        runner.run_test(test_name, lambda s=success: s, True,
-                       f"Accepted: {success}, Message: {message if not success else 'Success'}")
-        time.sleep(0.2)
+        runner.run_test_bool(test_name, success, True,
+                            f"Accepted: {success}, Message: {message if not success else 'Success'}")
+    
+    bulk_unregister(NORMAL_USER_USERNAME, created_entries)
+    
+    runner.print_summary()
+    return runner
+
+
+def test_version_counter():
+    """Test that every slot mutation increments the slot version"""
+    print_test_header("SLOT VERSION COUNTER TESTS")
+    runner = TestRunner("Slot Version Counter")
+    
+    def check_bump(action, write):
+        """Run write() and assert the slot version strictly increased"""
+        before = slot_version(get_current_slot(force=True))
+        success, message = write()
+        after = slot_version(get_current_slot(force=True))
+        bumped = success and before is not None and after is not None and after > before
+        runner.run_test_bool(f"{action} increments the slot version", bumped, True,
+                            f"Write: {message}, Version: {before} -> {after}")
+    
+    # Leave room for one registration
+    ensure_unregistered(NORMAL_USER2_USERNAME)
+    slot = get_current_slot(force=True) or {}
+    excess = slot.get("player_count", 0) - (MAX_PLAYERS - 1)
+    if excess > 0:
+        bulk_unregister(ADMIN_USERNAME, slot.get("players", [])[-excess:])
+    
+    check_bump("Register", lambda: register_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME)[:2])
+    check_bump("Unregister", lambda: unregister_player(NORMAL_USER2_USERNAME, NORMAL_USER2_USERNAME))
+    
+    guest_name = unique_guest("VersionGuest")
+    check_bump("Register guest", lambda: register_guest(NORMAL_USER_USERNAME, guest_name)[:2])
+    
+    def bulk_remove_guest():
+        entry = index_players(get_current_slot(force=True)).get(guest_name)
+        status = post_bulk_unregister(ADMIN_USERNAME, [entry] if entry else [])
+        return status == 200, f"Status: {status}"
+    check_bump("Bulk unregister", bulk_remove_guest)
+    
+    # Teams need exactly 10 registered entries: fill the slot with guests first
+    slot = get_current_slot(force=True) or {}
+    filler = [unique_guest("VersionFill") for _ in range(MAX_PLAYERS - slot.get("player_count", 0))]
+    register_guests(NORMAL_USER_USERNAME, filler)
+    
+    def set_teams():
+        details = get_slot_details(ADMIN_USERNAME)
+        ids = [p["id"] for p in (details or {}).get("players", [])]
+        if len(ids) != 10:
+            return False, f"Expected 10 registered entries, got {len(ids)}"
+        return admin_post("set-teams", ADMIN_USERNAME, {"teamA": ids[:5], "teamB": ids[5:]})
+    check_bump("Set teams", set_teams)
+    check_bump("Set scores", lambda: admin_post("set-scores", ADMIN_USERNAME, {"teamAScore": 0, "teamBScore": 0}))
+    
+    entries = index_players(get_current_slot(force=True))
+    bulk_unregister(ADMIN_USERNAME, [entries[name] for name in filler if name in entries])
     
     runner.print_summary()
     return runner
@@ -1746,25 +2087,37 @@ def test_special_characters_in_names():
 # MAIN EXECUTION
 # =============================================================================
 
+def crashed_suite(suite, error):
+    """Record a suite that raised as a failed runner so the run can continue"""
+    runner = TestRunner(suite.__name__)
+    runner.run_test_bool("Suite should run to completion", False, True,
+                        f"Exception: {type(error).__name__}: {error}")
+    runner.print_summary()
+    return runner
+
+
 def main():
     """Run all test suites"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}")
-    print("=" * 80)
-    print("SOCCER SLOT MANAGER - COMPREHENSIVE API TEST SUITE".center(80))
-    print("=" * 80)
-    print(f"{Colors.RESET}\n")
-    
-    print(f"{Colors.YELLOW}Testing Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.RESET}")
-    print(f"{Colors.YELLOW}Target URL: {BASE_URL}{Colors.RESET}")
-    print(f"{Colors.YELLOW}Configuration: MAX_PLAYERS={MAX_PLAYERS}{Colors.RESET}")
-    print(f"{Colors.YELLOW}Test Accounts:{Colors.RESET}")
-    print(f"  {Colors.YELLOW}Admin: {ADMIN_USERNAME} (PIN: {'*' * len(ADMIN_PIN)}){Colors.RESET}")
-    print(f"  {Colors.YELLOW}Normal User 1: {NORMAL_USER_USERNAME} (PIN: {'*' * len(NORMAL_USER_PIN)}){Colors.RESET}")
-    print(f"  {Colors.YELLOW}Normal User 2: {NORMAL_USER2_USERNAME} (PIN: {'*' * len(NORMAL_USER2_PIN)}){Colors.RESET}\n")
+    # Build the banner in one buffer and write it once
+    buf = [
+        f"\n{BOLD_BLUE}\n",
+        "=" * 80 + "\n",
+        "SOCCER SLOT MANAGER - COMPREHENSIVE API TEST SUITE".center(80) + "\n",
+        "=" * 80 + "\n",
+        f"{Colors.RESET}\n\n",
+        f"{Colors.YELLOW}Testing Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.RESET}\n",
+        f"{Colors.YELLOW}Target URL: {BASE_URL}{Colors.RESET}\n",
+        f"{Colors.YELLOW}Configuration: MAX_PLAYERS={MAX_PLAYERS}{Colors.RESET}\n",
+        f"{Colors.YELLOW}Test Accounts:{Colors.RESET}\n",
+        f"  {Colors.YELLOW}Admin: {ADMIN_USERNAME} (PIN: {'*' * len(ADMIN_PIN)}){Colors.RESET}\n",
+        f"  {Colors.YELLOW}Normal User 1: {NORMAL_USER_USERNAME} (PIN: {'*' * len(NORMAL_USER_PIN)}){Colors.RESET}\n",
+        f"  {Colors.YELLOW}Normal User 2: {NORMAL_USER2_USERNAME} (PIN: {'*' * len(NORMAL_USER2_PIN)}){Colors.RESET}\n\n",
+    ]
+    sys.stdout.write("".join(buf))
     
     # Check server is running
     if not check_server_running():
-        print(f"\n{Colors.RED}{Colors.BOLD}ERROR: Server is not running at {BASE_URL}{Colors.RESET}")
+        print(f"\n{BOLD_RED}ERROR: Server is not running at {BASE_URL}{Colors.RESET}")
         print(f"{Colors.YELLOW}Please ensure the Docker container is running:{Colors.RESET}")
         print(f"  docker-compose up -d")
         print(f"  docker-compose ps\n")
@@ -1774,9 +2127,13 @@ def main():
     
     # Verify test accounts exist
     print(f"{Colors.BOLD}Verifying test accounts...{Colors.RESET}")
-    admin_valid, _ = login(ADMIN_USERNAME, ADMIN_PIN)
-    user1_valid, _ = login(NORMAL_USER_USERNAME, NORMAL_USER_PIN)
-    user2_valid, _ = login(NORMAL_USER2_USERNAME, NORMAL_USER2_PIN)
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        admin_future = executor.submit(login, ADMIN_USERNAME, ADMIN_PIN)
+        user1_future = executor.submit(login, NORMAL_USER_USERNAME, NORMAL_USER_PIN)
+        user2_future = executor.submit(login, NORMAL_USER2_USERNAME, NORMAL_USER2_PIN)
+        admin_valid, _ = admin_future.result()
+        user1_valid, _ = user1_future.result()
+        user2_valid, _ = user2_future.result()
     
     print(f"  Admin account: {Colors.GREEN + '✓ Valid' if admin_valid else Colors.RED + '✗ Invalid'}{Colors.RESET}")
     print(f"  Normal User 1: {Colors.GREEN + '✓ Valid' if user1_valid else Colors.RED + '✗ Invalid'}{Colors.RESET}")
@@ -1789,22 +2146,28 @@ def main():
     # Run all test suites
     runners = []
     
+    # Phases 1-2 never modify the slot: they only read it or send writes that are rejected
+    # before any update (unknown users, invalid payloads, absent players), so they run concurrently
     # Basic connectivity and structure tests
-    print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 1: BASIC CONNECTIVITY & STRUCTURE ═══{Colors.RESET}")
-    runners.append(test_server_connectivity())
-    runners.append(test_slot_retrieval())
-    runners.append(test_input_validation())
-    runners.append(test_business_logic_via_api())
-    runners.append(test_error_handling())
+    print(f"\n{BOLD_BLUE}═══ PHASE 1: BASIC CONNECTIVITY & STRUCTURE ═══{Colors.RESET}")
+    runners.extend(run_suites_parallel([
+        test_server_connectivity,
+        test_slot_retrieval,
+        test_input_validation,
+        test_business_logic_via_api,
+        test_error_handling,
+    ], on_error=crashed_suite))
     
     # Authentication tests (no auth required)
-    print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 2: AUTHENTICATION & AUTHORIZATION ═══{Colors.RESET}")
-    runners.append(test_authentication())
-    runners.append(test_registration_without_auth())
+    print(f"\n{BOLD_BLUE}═══ PHASE 2: AUTHENTICATION & AUTHORIZATION ═══{Colors.RESET}")
+    runners.extend(run_suites_parallel([
+        test_authentication,
+        test_registration_without_auth,
+    ], on_error=crashed_suite))
     
     # Normal user tests (requires valid normal user account)
     if user1_valid:
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 3: NORMAL USER FUNCTIONALITY ═══{Colors.RESET}")
+        print(f"\n{BOLD_BLUE}═══ PHASE 3: NORMAL USER FUNCTIONALITY ═══{Colors.RESET}")
         runners.append(test_normal_user_authentication())
         runners.append(test_normal_user_registration())
         runners.append(test_normal_user_guest_registration())
@@ -1817,17 +2180,19 @@ def main():
     
     # Admin user tests (requires valid admin account)
     if admin_valid:
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 4: ADMIN USER FUNCTIONALITY ═══{Colors.RESET}")
+        print(f"\n{BOLD_BLUE}═══ PHASE 4: ADMIN USER FUNCTIONALITY ═══{Colors.RESET}")
         runners.append(test_admin_authentication())
         runners.append(test_admin_registration())
         runners.append(test_admin_can_remove_any_player())
         runners.append(test_admin_guest_management())
+        if user1_valid and user2_valid:
+            runners.append(test_bulk_unregistration())
     else:
         print(f"\n{Colors.YELLOW}⊘ Skipping admin tests (invalid credentials){Colors.RESET}")
     
     # Integration and journey tests
     if user1_valid and user2_valid:
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 5: INTEGRATION & USER JOURNEYS ═══{Colors.RESET}")
+        print(f"\n{BOLD_BLUE}═══ PHASE 5: INTEGRATION & USER JOURNEYS ═══{Colors.RESET}")
         runners.append(test_complete_user_journey())
         runners.append(test_multi_user_interactions())
     else:
@@ -1835,7 +2200,8 @@ def main():
     
     # Slot capacity tests (requires admin account to clear/fill slot)
     if admin_valid and user1_valid:
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 6: SLOT CAPACITY & FILLING TESTS ═══{Colors.RESET}")
+        print(f"\n{BOLD_BLUE}═══ PHASE 6: SLOT CAPACITY & FILLING TESTS ═══{Colors.RESET}")
+        # Keep these two back-to-back: full-slot tests reuse the 10/10 slot left by progressive filling
         runners.append(test_progressive_slot_filling())
         runners.append(test_full_slot_behavior())
         runners.append(test_boundary_conditions())
@@ -1844,13 +2210,14 @@ def main():
     
     # Advanced tests (requires multiple user accounts)
     if admin_valid and user1_valid and user2_valid:
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 7: ADVANCED FUNCTIONALITY TESTS ═══{Colors.RESET}")
+        print(f"\n{BOLD_BLUE}═══ PHASE 7: ADVANCED FUNCTIONALITY TESTS ═══{Colors.RESET}")
         runners.append(test_guest_permission_boundaries())
         runners.append(test_data_consistency())
         runners.append(test_error_message_quality())
         runners.append(test_rapid_operations())
         runners.append(test_timestamp_validation())
         runners.append(test_special_characters_in_names())
+        runners.append(test_version_counter())
     else:
         print(f"\n{Colors.YELLOW}⊘ Skipping advanced tests (requires all test accounts){Colors.RESET}")
     
@@ -1861,59 +2228,57 @@ def main():
     for r in runners:
         all_failed_tests.extend(r.failed_tests)
     
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}OVERALL SUMMARY{' '*64}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.RESET}")
-    print(f"\n{Colors.BOLD}Total Test Cases: {total_tests}{Colors.RESET}")
-    print(f"{Colors.GREEN}{Colors.BOLD}Passed: {total_passed}{Colors.RESET}")
-    print(f"{Colors.RED}{Colors.BOLD}Failed: {total_tests - total_passed}{Colors.RESET}")
-    print(f"{Colors.BOLD}Success Rate: {(total_passed/total_tests*100):.1f}%{Colors.RESET}\n")
+    # Summary sections are assembled in one buffer and written once
+    buf = [
+        f"\n{BAR80_BLUE}\n",
+        f"{BOLD_BLUE}OVERALL SUMMARY{' '*64}{Colors.RESET}\n",
+        f"{BAR80_BLUE}\n",
+        f"\n{Colors.BOLD}Total Test Cases: {total_tests}{Colors.RESET}\n",
+        f"{BOLD_GREEN}Passed: {total_passed}{Colors.RESET}\n",
+        f"{BOLD_RED}Failed: {total_tests - total_passed}{Colors.RESET}\n",
+        f"{Colors.BOLD}Success Rate: {(total_passed/total_tests*100):.1f}%{Colors.RESET}\n\n",
+    ]
     
     if total_passed == total_tests:
-        print(f"{Colors.GREEN}{Colors.BOLD}🎉 ALL TESTS PASSED! 🎉{Colors.RESET}\n")
+        buf.append(f"{BOLD_GREEN}🎉 ALL TESTS PASSED! 🎉{Colors.RESET}\n\n")
     else:
-        print(f"{Colors.YELLOW}{Colors.BOLD}⚠️  Some tests failed - review details below{Colors.RESET}\n")
+        buf.append(f"{BOLD_YELLOW}⚠️  Some tests failed - review details below{Colors.RESET}\n\n")
         
-        # Print detailed failed tests summary
+        # Detailed failed tests summary
         if all_failed_tests:
-            print(f"{Colors.BOLD}{Colors.RED}{'='*80}{Colors.RESET}")
-            print(f"{Colors.BOLD}{Colors.RED}FAILED TESTS SUMMARY ({len(all_failed_tests)} failures){Colors.RESET}")
-            print(f"{Colors.BOLD}{Colors.RED}{'='*80}{Colors.RESET}\n")
+            buf.append(f"{BAR80_RED}\n")
+            buf.append(f"{BOLD_RED}FAILED TESTS SUMMARY ({len(all_failed_tests)} failures){Colors.RESET}\n")
+            buf.append(f"{BAR80_RED}\n\n")
             
             # Group by suite
-            suite_failures = {}
+            suite_failures = defaultdict(list)
             for failure in all_failed_tests:
-                suite = failure.get('suite', 'Unknown')
-                if suite not in suite_failures:
-                    suite_failures[suite] = []
-                suite_failures[suite].append(failure)
+                suite_failures[failure.get('suite', 'Unknown')].append(failure)
             
             for suite_name, failures in suite_failures.items():
-                print(f"{Colors.BOLD}{Colors.YELLOW}[{suite_name}] - {len(failures)} failure(s){Colors.RESET}")
+                buf.append(f"{BOLD_YELLOW}[{suite_name}] - {len(failures)} failure(s){Colors.RESET}\n")
                 for i, failure in enumerate(failures, 1):
-                    print(f"  {Colors.RED}{i}.{Colors.RESET} {failure['name']}")
-                    print(f"     {Colors.YELLOW}→ {failure['details']}{Colors.RESET}")
-                print()
+                    buf.append(f"  {Colors.RED}{i}.{Colors.RESET} {failure['name']}\n")
+                    buf.append(f"     {Colors.YELLOW}→ {failure['details']}{Colors.RESET}\n")
+                buf.append("\n")
             
-            print(f"{Colors.BOLD}{Colors.RED}{'='*80}{Colors.RESET}\n")
+            buf.append(f"{BAR80_RED}\n\n")
+    
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
     
     # Cleanup: Clear all players from slot after tests
     if admin_valid:
-        print(f"{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.BLUE}CLEANUP - CLEARING SLOT{' '*59}{Colors.RESET}")
-        print(f"{Colors.BOLD}{Colors.BLUE}{'='*80}{Colors.RESET}\n")
+        print(BAR80_BLUE)
+        print(f"{BOLD_BLUE}CLEANUP - CLEARING SLOT{' '*59}{Colors.RESET}")
+        print(f"{BAR80_BLUE}\n")
         
         slot = get_current_slot()
         if slot:
             players = slot.get("players", [])
             if players:
                 print(f"{Colors.YELLOW}Removing {len(players)} player(s) from slot...{Colors.RESET}")
-                removed_count = 0
-                for player in players:
-                    success, _ = unregister_player(ADMIN_USERNAME, player)
-                    if success:
-                        removed_count += 1
-                    time.sleep(0.1)
+                removed_count, _ = bulk_unregister(ADMIN_USERNAME, players)
                 
                 # Verify slot is empty
                 final_slot = get_current_slot()
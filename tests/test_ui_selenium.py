@@ -6,7 +6,6 @@ Uses Selenium WebDriver for browser automation testing
 
 import time
 import random
-from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -18,9 +17,17 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 import subprocess
 import shutil
+import functools
+import atexit
+import itertools
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import os
 import platform
 
+from _parallel import run_suites_parallel
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
@@ -44,6 +51,31 @@ ADMIN_USER = {
     "pin": "0000"
 }
 
+# =============================================================================
+# LOCATORS
+# =============================================================================
+
+class Locators:
+    """Shared (By, selector) pairs for elements used by several suites"""
+    LOGIN_BTN = (By.CSS_SELECTOR, "[data-testid='login-btn']")
+    LOGOUT_BTN = (By.CSS_SELECTOR, "[data-testid='logout-btn']")
+    SIGNUP_BTN = (By.CSS_SELECTOR, "[data-testid='signup-btn']")
+    CURRENT_USER = (By.CSS_SELECTOR, "[data-testid='current-user']")
+    REGISTER_BTN = (By.CSS_SELECTOR, "[data-testid='register-btn']")
+    UNREGISTER_BTN = (By.CSS_SELECTOR, "[data-testid='unregister-btn']")
+    PLAYER_COUNT = (By.CSS_SELECTOR, "[data-testid='player-count']")
+    GUEST_SECTION = (By.CSS_SELECTOR, "[data-testid='guest-section']")
+    GUEST_INPUT = (By.CSS_SELECTOR, "[data-testid='guest-input']")
+    GUEST_SUBMIT = (By.CSS_SELECTOR, "[data-testid='guest-submit']")
+    MODAL = (By.CSS_SELECTOR, ".modal.show")
+    MODAL_TITLE = (By.CSS_SELECTOR, ".modal.show h2")
+    MODAL_USER = (By.CSS_SELECTOR, ".modal.show input[type='text']")
+    MODAL_PIN = (By.CSS_SELECTOR, ".modal.show input[type='password']")
+    MODAL_ERROR = (By.CSS_SELECTOR, ".modal.show .error")
+    LOGIN_SUBMIT = (By.CSS_SELECTOR, "[data-testid='login-submit']")
+    LOGIN_CANCEL = (By.CSS_SELECTOR, "[data-testid='login-cancel']")
+    ERROR = (By.CSS_SELECTOR, ".error")
+
 # =============================================================================
 # COLOR OUTPUT
 # =============================================================================
@@ -59,81 +91,89 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Banner and rule strings, built once at import
+_EQ70 = "=" * 70
+_HEAVY70 = "═" * 70
+_DASH70 = "─" * 70
+_HDR = f"{Colors.BOLD}{Colors.BLUE}{_EQ70}{Colors.RESET}"
+_HDR2 = f"{Colors.BOLD}{Colors.BLUE}{_HEAVY70}{Colors.RESET}"
+_RULE = f"{Colors.BOLD}{_DASH70}{Colors.RESET}"
+
 def print_test_header(title):
     """Print formatted test section header"""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.RESET}")
+    print(f"\n{Colors.BOLD}{Colors.CYAN}{_EQ70}{Colors.RESET}")
     print(f"{Colors.BOLD}{Colors.CYAN}{title:^70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'='*70}{Colors.RESET}\n")
+    print(f"{Colors.BOLD}{Colors.CYAN}{_EQ70}{Colors.RESET}\n")
 
 # =============================================================================
 # TEST RUNNER
 # =============================================================================
 
+# Runner most recently created on each thread, so a suite that crashes can still be reported
+_active_runner = threading.local()
+
 class TestRunner:
-    def __init__(self, suite_name):
+    def __init__(self, suite_name, critical=False):
         self.suite_name = suite_name
+        self.critical = critical  # A failure here dooms later suites, so main() stops early
+        _active_runner.runner = self
         self.passed = 0
         self.failed = 0
         self.tests = []
+        self.lines = []  # Result lines, written out together by print_summary
     
-    def run_test(self, test_name, test_func, expected, context=""):
-        """Run a single test and track results"""
-        try:
-            result = test_func()
-            success = (result == expected) if not callable(expected) else expected()
-            
-            if success:
-                self.passed += 1
-                status = f"{Colors.GREEN}✓ PASS{Colors.RESET}"
-            else:
-                self.failed += 1
-                status = f"{Colors.RED}✗ FAIL{Colors.RESET}"
-            
-            self.tests.append({
-                "name": test_name,
-                "passed": success,
-                "context": context
-            })
-            
-            context_str = f" - {context}" if context else ""
-            print(f"{status} {test_name}{context_str}")
-            
-        except Exception as e:
+    def run_test(self, test_name, result, expected, context=""):
+        """Record the outcome of a single, already evaluated test"""
+        success = result == expected
+        
+        if success:
+            self.passed += 1
+            status = f"{Colors.GREEN}✓ PASS{Colors.RESET}"
+        else:
             self.failed += 1
-            status = f"{Colors.RED}✗ ERROR{Colors.RESET}"
-            error_msg = str(e)
-            self.tests.append({
-                "name": test_name,
-                "passed": False,
-                "context": f"Exception: {error_msg}"
-            })
-            print(f"{status} {test_name} - Exception: {error_msg}")
+            status = f"{Colors.RED}✗ FAIL{Colors.RESET}"
+        
+        self.tests.append({
+            "name": test_name,
+            "passed": success,
+            "context": context
+        })
+        
+        context_str = f" - {context}" if context else ""
+        self.lines.append(f"{status} {test_name}{context_str}")
     
     def print_summary(self):
-        """Print test suite summary"""
+        """Print buffered test results followed by the suite summary"""
         total = self.passed + self.failed
         success_rate = (self.passed / total * 100) if total > 0 else 0
         
-        print(f"\n{Colors.BOLD}{'─'*70}{Colors.RESET}")
-        print(f"{Colors.BOLD}{self.suite_name} Summary:{Colors.RESET}")
-        print(f"  Total:  {total}")
-        print(f"  {Colors.GREEN}Passed: {self.passed}{Colors.RESET}")
-        print(f"  {Colors.RED}Failed: {self.failed}{Colors.RESET}")
-        print(f"  Success Rate: {success_rate:.1f}%")
-        print(f"{Colors.BOLD}{'─'*70}{Colors.RESET}")
+        self.lines += [
+            f"\n{_RULE}",
+            f"{Colors.BOLD}{self.suite_name} Summary:{Colors.RESET}",
+            f"  Total:  {total}",
+            f"  {Colors.GREEN}Passed: {self.passed}{Colors.RESET}",
+            f"  {Colors.RED}Failed: {self.failed}{Colors.RESET}",
+            f"  Success Rate: {success_rate:.1f}%",
+            _RULE,
+        ]
+        sys.stdout.write("\n".join(self.lines) + "\n")
+        self.lines = []
 
 # =============================================================================
 # SELENIUM HELPER FUNCTIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def is_wsl():
     """Detect if running in Windows Subsystem for Linux"""
     try:
         with open('/proc/version', 'r') as f:
-            return 'microsoft' in f.read().lower() or 'wsl' in f.read().lower()
-    except:
+            version = f.read().lower()
+        return 'microsoft' in version or 'wsl' in version
+    except OSError:
         return False
 
+@functools.lru_cache(maxsize=None)
 def check_chrome_dependencies():
     """Check if required Chrome dependencies are installed"""
     required_libs = [
@@ -142,18 +182,21 @@ def check_chrome_dependencies():
         'libfontconfig1'
     ]
     
-    missing = []
-    for lib in required_libs:
-        result = subprocess.run(
-            ['dpkg', '-l', lib],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            missing.append(lib)
+    # Single dpkg call; installed entries look like "ii  libnss3:amd64  2:3.98-1  ..."
+    result = subprocess.run(
+        ['dpkg', '-l'],
+        capture_output=True,
+        text=True
+    )
+    installed = {
+        line.split()[1].split(':')[0]
+        for line in result.stdout.splitlines()
+        if line.startswith('ii ') and len(line.split()) > 1
+    }
     
-    return missing
+    return [lib for lib in required_libs if lib not in installed]
 
+@functools.lru_cache(maxsize=None)
 def check_browser_availability():
     """Check which browsers are available"""
     browsers = {
@@ -241,6 +284,52 @@ def create_driver(headless=True, browser_preference=['chrome', 'chromium', 'fire
     
     raise RuntimeError(error_msg)
 
+# Persistent browser profiles keep the HTTP and compiled-JS caches warm across runs.
+# Each driver leases its own numbered profile: Chrome locks a profile to one process.
+# A lease is an exclusive lock on the profile's lock file, held until this process exits,
+# so concurrent test runs skip profiles already in use instead of sharing them.
+PROFILE_ROOT = os.path.expanduser("~/.cache/soccer-slot-ui-tests")
+PROFILE_LOCK_FILE = ".lease.lock"
+_profile_counter = itertools.count()
+_profile_lock = threading.Lock()
+_profile_leases = []
+
+def _try_lock_file(lock_file):
+    """Take a non-blocking exclusive lock on an open file. Returns False if another process holds it"""
+    try:
+        import fcntl
+    except ImportError:  # Native Windows: no fcntl, lock the first byte instead
+        import msvcrt
+        try:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+def lease_profile_dir(browser):
+    """Return (creating it if needed) the next persistent profile directory not in use by another run"""
+    while True:
+        with _profile_lock:
+            index = next(_profile_counter)
+        path = os.path.join(PROFILE_ROOT, f"{browser}-profile-{index}")
+        os.makedirs(path, exist_ok=True)
+        lock_file = open(os.path.join(path, PROFILE_LOCK_FILE), "a")  # "a": never truncate a held lock file
+        if not _try_lock_file(lock_file):
+            lock_file.close()  # Held by another run: try the next number
+            continue
+        with _profile_lock:
+            _profile_leases.append(lock_file)
+        return path
+
+# Driver binary paths resolved in this run, keyed by browser ('chrome'/'firefox'), so later
+# drivers (e.g. the worker pool) skip Selenium Manager's discovery
+_DRIVER_PATHS = {}
+
 def create_chrome_driver(headless=True, browser_binary=None, wsl=False):
     """Create Chrome/Chromium WebDriver"""
     options = ChromeOptions()
@@ -258,10 +347,22 @@ def create_chrome_driver(headless=True, browser_binary=None, wsl=False):
     options.add_argument('--disable-blink-features=AutomationControlled')
     options.add_argument('--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36')
     
+    # Less rendering work per navigation: no timer/renderer throttling between
+    # suites, no image decoding, no animations
+    options.add_argument('--disable-background-timer-throttling')
+    options.add_argument('--disable-renderer-backgrounding')
+    options.add_argument('--disable-backgrounding-occluded-windows')
+    options.add_argument('--disable-features=TranslateUI')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--force-prefers-reduced-motion')
+    
     # Additional options for WSL
     if wsl:
         options.add_argument('--disable-setuid-sandbox')
-        options.add_argument('--single-process')  # Run in single process mode
+    
+    # Single-process mode serializes rendering; only enable it for setups that crash without it
+    if os.environ.get('SELENIUM_SINGLE_PROCESS'):
+        options.add_argument('--single-process')
     
     # Set binary location if specified
     if browser_binary:
@@ -270,20 +371,33 @@ def create_chrome_driver(headless=True, browser_binary=None, wsl=False):
             if chromium_path:
                 options.binary_location = chromium_path
     
+    options.add_argument(f"--user-data-dir={lease_profile_dir('chrome')}")
+    
     # Suppress logging
     options.add_experimental_option('excludeSwitches', ['enable-logging'])
     
+    # Tests only inspect DOM text/attributes: skip images and return from get() on DOMContentLoaded
+    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    options.page_load_strategy = 'eager'
+    
     try:
-        # Try to use system chromedriver first
-        chromedriver_path = shutil.which('chromedriver')
+        # Reuse a path resolved earlier in this run, else try the system chromedriver
+        chromedriver_path = _DRIVER_PATHS.get('chrome') or shutil.which('chromedriver')
         if chromedriver_path:
             service = ChromeService(executable_path=chromedriver_path)
             driver = webdriver.Chrome(service=service, options=options)
         else:
             # Let Selenium manage the driver
             driver = webdriver.Chrome(options=options)
+        _DRIVER_PATHS['chrome'] = driver.service.path
         
-        driver.implicitly_wait(5)
+        # Keep the HTTP cache on so repeat navigations (_nav) reuse the app's assets
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": False})
+        
+        # No implicit wait: absence probes (logout_user, is_modal_visible) must fail fast;
+        # intentional waits go through wait_for_element/wait_for_clickable/wait_for_visible
+        driver.implicitly_wait(0)
         return driver
     except WebDriverException as e:
         error_msg = str(e)
@@ -310,10 +424,104 @@ def create_firefox_driver(headless=True):
     options.add_argument('--width=1920')
     options.add_argument('--height=1080')
     
-    driver = webdriver.Firefox(options=options)
-    driver.implicitly_wait(5)
+    options.add_argument('-profile')
+    options.add_argument(lease_profile_dir('firefox'))
+    
+    # Same trade-offs as create_chrome_driver: no images, eager page loads
+    options.set_preference('permissions.default.image', 2)
+    options.page_load_strategy = 'eager'
+    
+    geckodriver_path = _DRIVER_PATHS.get('firefox')
+    if geckodriver_path:
+        driver = webdriver.Firefox(service=FirefoxService(executable_path=geckodriver_path), options=options)
+    else:
+        driver = webdriver.Firefox(options=options)
+    _DRIVER_PATHS['firefox'] = driver.service.path
+    driver.implicitly_wait(0)  # See create_chrome_driver
     return driver
 
+# Session-wide WebDriver shared by all suites (browser startup is paid once)
+_DRIVER = None
+
+def get_shared_driver(headless=True):
+    """Return the shared WebDriver, creating it on first use"""
+    global _DRIVER
+    if _DRIVER is None:
+        _DRIVER = create_driver(headless=headless)
+    return _DRIVER
+
+def quit_shared_driver():
+    """Quit the shared WebDriver if it was started"""
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        finally:
+            _DRIVER = None
+
+atexit.register(quit_shared_driver)
+
+def _reset_page(driver, anchor=None):
+    """Drop client state, reload the app and wait until it is actually ready (no fixed sleep)"""
+    anchor = anchor or Locators.LOGIN_BTN
+    driver.delete_all_cookies()
+    # The app keeps the logged-in user in localStorage, so clear storage as well
+    try:
+        driver.execute_script("window.scrollTo(0, 0); window.sessionStorage.clear(); window.localStorage.clear();")
+    except WebDriverException:
+        pass  # e.g. a fresh session still on about:blank, which has no storage
+    _nav(driver, BASE_URL)
+    # A fresh process on a persistent profile may still hold a previous run's login:
+    # drop it and let the app log out in place rather than navigating a second time
+    driver.execute_script(
+        "if (localStorage.length > 0 || sessionStorage.length > 0) {"
+        " localStorage.clear(); sessionStorage.clear();"
+        " window.dispatchEvent(new Event('app:session')); }")
+    wait_for_app_ready(driver)
+    wait_until(driver, EC.presence_of_element_located(anchor))
+
+def wait_for_app_ready(driver, timeout=3):
+    """Wait for the page's __APP_READY__ beacon (initial slot fetch rendered)"""
+    # readyState is only a fallback for pages that never define the beacon
+    return wait_until(driver, lambda d: d.execute_script(
+        "return window.__APP_READY__ === true"
+        " || (window.__APP_READY__ === undefined && document.readyState === 'complete');"),
+        timeout=timeout)
+
+def _nav(driver, url):
+    """Navigate and return once the new document is parsed (CDP Page.navigate on Chromium)"""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        # Firefox has no CDP: fall back to a regular get()
+        driver.get(url)
+        return
+    
+    # Tag the current document so the wait below cannot be satisfied by it
+    try:
+        driver.execute_script("window.__staleDocument = true;")
+    except WebDriverException:
+        pass
+    driver.execute_cdp_cmd("Page.navigate", {"url": url})
+    wait_until(driver, lambda d: d.execute_script(
+        "return !window.__staleDocument && document.readyState !== 'loading';"))
+
+def _soft_reset(driver):
+    """Reset client state in place (no reload), keeping the warm document and JS VM"""
+    driver.execute_script("""
+        document.querySelectorAll('.modal.show').forEach(m => m.classList.remove('show'));
+        window.sessionStorage.clear();
+        window.localStorage.clear();
+        history.replaceState({}, '', '/');
+        window.dispatchEvent(new Event('app:session'));
+    """)
+    wait_for_app_ready(driver)
+    wait_until(driver, EC.visibility_of_element_located(Locators.LOGIN_BTN))
+
+def _between_suites(driver):
+    """Drop auth and pending loads between suites while keeping the browser's HTTP/JS caches warm"""
+    driver.execute_script("window.stop();")
+    driver.delete_all_cookies()
+    _soft_reset(driver)
+
 def wait_for_element(driver, by, value, timeout=10):
     """Wait for element to be present"""
     try:
@@ -334,6 +542,67 @@ def wait_for_clickable(driver, by, value, timeout=10):
     except TimeoutException:
         return None
 
+def wait_for_visible(driver, by, value, timeout=10):
+    """Wait for element to be visible"""
+    try:
+        element = WebDriverWait(driver, timeout).until(
+            EC.visibility_of_element_located((by, value))
+        )
+        return element
+    except TimeoutException:
+        return None
+
+def wait_until(driver, cond, timeout=5, poll=0.05):
+    """Poll an expected condition until it holds; returns its result, or None on timeout"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=poll).until(cond)
+    except TimeoutException:
+        return None
+
+# Everything test_page_load and test_data_display assert on, read in one WebDriver round-trip
+PAGE_SNAPSHOT_JS = """
+const text = (sel) => { const el = document.querySelector(sel); return el ? el.innerText.trim() : null; };
+const visible = (sel) => { const el = document.querySelector(sel); return el ? el.getClientRects().length > 0 : null; };
+const h1 = document.querySelector('h1');
+return {
+    title: document.title,
+    container: !!document.querySelector('.container'),
+    h1: h1 ? { text: h1.innerText.trim(), visible: h1.getClientRects().length > 0 } : null,
+    date: text("[data-testid='slot-date']"),
+    table: !!document.querySelector('table'),
+    headers: Array.from(document.querySelectorAll('th'), e => e.innerText.trim()),
+    rowCount: document.querySelectorAll('tbody tr').length,
+    rowNums: Array.from(document.querySelectorAll('tbody td:first-child'), e => e.innerText.trim()),
+    countText: text("[data-testid='player-count']"),
+    loginVisible: visible("[data-testid='login-btn']"),
+    signupVisible: visible("[data-testid='signup-btn']")
+};
+"""
+
+def page_snapshot(driver):
+    """Return the page fields checked by the display suites as a dict"""
+    return driver.execute_script(PAGE_SNAPSHOT_JS)
+
+def set_input(driver, element, value):
+    """Set an input's value in one script call and fire 'input' so Vue's v-model picks it up"""
+    driver.execute_script(
+        "arguments[0].value = arguments[1];"
+        "arguments[0].dispatchEvent(new Event('input', { bubbles: true }));",
+        element, value)
+
+def has(driver, locator):
+    """Return whether a CSS locator matches anything, without marshalling the elements"""
+    return driver.execute_script("return !!document.querySelector(arguments[0]);", locator[1])
+
+def count(driver, locator):
+    """Return how many elements a CSS locator matches, in one script call"""
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length;", locator[1])
+
+def text_of(driver, locator):
+    """Return the innerText of the first element a CSS locator matches, or None"""
+    return driver.execute_script(
+        "const el = document.querySelector(arguments[0]); return el ? el.innerText : null;", locator[1])
+
 def is_modal_visible(driver, modal_class):
     """Check if a modal is visible"""
     try:
@@ -342,42 +611,144 @@ def is_modal_visible(driver, modal_class):
     except NoSuchElementException:
         return False
 
+# localStorage 'currentUser' values captured after each successful login, keyed by username
+_SESSIONS = {}
+
 def login_user(driver, username, pin):
     """Helper to log in a user"""
     # Click login button in header
-    login_btn = wait_for_clickable(driver, By.XPATH, "//button[contains(text(), 'Connexion')]")
+    login_btn = wait_for_clickable(driver, *Locators.LOGIN_BTN)
     if not login_btn:
         return False
     login_btn.click()
     
-    time.sleep(0.5)
+    # Wait for the login form to open (modals stay in the DOM, so wait on visibility)
+    pin_input = wait_for_visible(driver, *Locators.MODAL_PIN, timeout=5)
+    if not pin_input:
+        return False
     
     # Fill login form
-    username_input = driver.find_element(By.CSS_SELECTOR, "input[type='text']")
-    pin_input = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+    username_input = driver.find_element(*Locators.MODAL_USER)
     
-    username_input.clear()
-    username_input.send_keys(username)
-    pin_input.clear()
-    pin_input.send_keys(pin)
+    set_input(driver, username_input, username)
+    set_input(driver, pin_input, pin)
     
     # Submit
-    submit_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Se connecter')]")
+    submit_btn = driver.find_element(*Locators.LOGIN_SUBMIT)
     submit_btn.click()
     
-    time.sleep(1)
+    # Wait until the logout button shows up or the login modal closes
+    try:
+        WebDriverWait(driver, 5).until(EC.any_of(
+            EC.visibility_of_element_located(Locators.LOGOUT_BTN),
+            EC.invisibility_of_element_located(Locators.MODAL_PIN)
+        ))
+    except TimeoutException:
+        pass
+    
+    # Remember the session so later suites can skip the login modal
+    stored = driver.execute_script("return window.localStorage.getItem('currentUser');")
+    if stored:
+        _SESSIONS[username] = stored
     return True
 
+def restore_session(driver, username, pin):
+    """Log in by replaying a cached session, falling back to the login modal"""
+    stored = _SESSIONS.get(username)
+    if stored is None:
+        return login_user(driver, username, pin)
+    
+    # The app keeps the logged-in user in localStorage; 'app:session' makes it reload
+    # that user in place, so the soft reset between suites is not undone by a page reload
+    driver.execute_script(
+        "window.localStorage.setItem('currentUser', arguments[0]);"
+        "window.dispatchEvent(new Event('app:session'));", stored)
+    wait_for_app_ready(driver)
+    if wait_until(driver, EC.visibility_of_element_located(Locators.LOGOUT_BTN), timeout=2):
+        return True
+    
+    # Fallback for a page without the in-place hook: it reads localStorage on mount
+    driver.refresh()
+    return wait_until(driver, EC.visibility_of_element_located(Locators.LOGOUT_BTN)) is not None
+
 def logout_user(driver):
     """Helper to log out current user"""
     try:
-        logout_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Déconnexion')]")
+        logout_btn = driver.find_element(*Locators.LOGOUT_BTN)
         logout_btn.click()
-        time.sleep(0.5)
+        # Wait for the header to switch back to the logged-out state
+        try:
+            WebDriverWait(driver, 5).until(
+                EC.invisibility_of_element_located(Locators.LOGOUT_BTN)
+            )
+        except TimeoutException:
+            pass
         return True
     except NoSuchElementException:
         return False
 
+# =============================================================================
+# PARALLEL SUITE EXECUTION
+# =============================================================================
+
+# WebDriver pool: each worker thread lazily creates one browser and reuses it for every suite it runs
+_worker = threading.local()
+_pool_drivers = []
+_pool_lock = threading.Lock()
+
+def get_worker_driver(headless=True):
+    """Return the calling worker thread's WebDriver, creating it on first use"""
+    driver = getattr(_worker, "driver", None)
+    if driver is None:
+        driver = _worker.driver = create_driver(headless=headless)
+        with _pool_lock:
+            _pool_drivers.append(driver)
+    return driver
+
+def quit_pool_drivers():
+    """Quit every browser created by the worker pool"""
+    with _pool_lock:
+        drivers = _pool_drivers[:]
+        _pool_drivers.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+def run_suite_pooled(suite):
+    """Run a suite on the worker's pooled browser, starting from a clean app page"""
+    driver = get_worker_driver()
+    if driver.current_url.startswith(BASE_URL):
+        # A previous read-only suite left the app loaded: reset it in place, no reload
+        _soft_reset(driver)
+    else:
+        _reset_page(driver)
+    return suite(driver)
+
+def crashed_suite(suite, error):
+    """Report a suite that raised as a failed runner, keeping the results it recorded so far"""
+    print(f"{Colors.RED}Fatal error in {suite.__name__}: {error}{Colors.RESET}")
+    runner = getattr(_active_runner, "runner", None)
+    if runner is None:
+        # Crashed before creating its runner (browser setup): later suites would hit the same problem
+        runner = TestRunner(suite.__name__, critical=True)
+    runner.run_test("Suite should run to completion", False, True, f"Error: {error}")
+    runner.print_summary()
+    return runner
+
+def run_suites_parallel_pooled(suites, max_workers=4):
+    """Run read-only suites concurrently on a browser pool. Output is replayed suite by suite.
+    Returns one runner per suite, in order (a failed runner for a suite that crashed)"""
+    def run(suite):
+        _active_runner.runner = None
+        return run_suite_pooled(suite)
+    
+    try:
+        return run_suites_parallel(suites, run, crashed_suite, max_workers=max_workers)
+    finally:
+        quit_pool_drivers()
+
 # =============================================================================
 # UI TEST SUITES
 # =============================================================================
@@ -385,80 +756,76 @@ def logout_user(driver):
 def test_page_load(driver):
     """Test that the page loads correctly"""
     print_test_header("PAGE LOAD TESTS")
-    runner = TestRunner("Page Load")
+    runner = TestRunner("Page Load", critical=True)
     
-    # Test 1: Page loads successfully
-    test_name = "Page loads with 200 status"
+    # The suite's preparation step has already loaded the app: wait for its initial
+    # render to finish, then read everything in one call
     try:
-        driver.get(BASE_URL)
-        loaded = "Soccer Slot Manager" in driver.title
-        runner.run_test(test_name, lambda: loaded, True,
-                       f"Title: {driver.title}")
+        wait_for_app_ready(driver)
+        snap = page_snapshot(driver)
+        load_error = None
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        snap, load_error = {}, e
+    
+    # Test 1: Page loads successfully
+    test_name = "Page loads with 200 status"
+    title = snap.get("title") or ""
+    runner.run_test(test_name, "Soccer Slot Manager" in title, True,
+                   f"Error: {load_error}" if load_error else f"Title: {title}")
     
     # Test 2: Main container is present
     test_name = "Main container element is present"
-    container = wait_for_element(driver, By.CSS_SELECTOR, ".container")
-    runner.run_test(test_name, lambda: container is not None, True,
-                   f"Container found: {container is not None}")
+    runner.run_test(test_name, bool(snap.get("container")), True,
+                   f"Container found: {bool(snap.get('container'))}")
     
     # Test 3: Page title is visible
     test_name = "Page title 'Soccer Slot Manager' is visible"
-    try:
-        h1 = driver.find_element(By.TAG_NAME, "h1")
-        visible = h1.is_displayed() and "Soccer Slot Manager" in h1.text
-        runner.run_test(test_name, lambda: visible, True,
-                       f"Title: {h1.text}")
-    except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Title not found")
+    h1 = snap.get("h1")
+    if h1:
+        visible = h1["visible"] and "Soccer Slot Manager" in h1["text"]
+        runner.run_test(test_name, visible, True,
+                       f"Title: {h1['text']}")
+    else:
+        runner.run_test(test_name, False, True, "Title not found")
     
     # Test 4: Slot date is displayed
     test_name = "Slot date information is displayed"
-    try:
-        date_paragraph = driver.find_element(By.XPATH, "//p[contains(@class, 'date')]")
-        has_date = date_paragraph.text != ""
-        runner.run_test(test_name, lambda: has_date, True,
-                       f"Date: {date_paragraph.text[:50]}")
-    except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Date not found")
+    date_text = snap.get("date")
+    if date_text is not None:
+        runner.run_test(test_name, date_text != "", True,
+                       f"Date: {date_text[:50]}")
+    else:
+        runner.run_test(test_name, False, True, "Date not found")
     
     # Test 5: Players table is present
     test_name = "Players table is rendered"
-    table = wait_for_element(driver, By.TAG_NAME, "table")
-    runner.run_test(test_name, lambda: table is not None, True,
-                   f"Table found: {table is not None}")
+    runner.run_test(test_name, bool(snap.get("table")), True,
+                   f"Table found: {bool(snap.get('table'))}")
     
     # Test 6: Table has correct headers
     test_name = "Table headers are correct (N°, Joueur, Date d'inscription)"
-    try:
-        headers = driver.find_elements(By.TAG_NAME, "th")
-        header_texts = [h.text for h in headers]
-        correct = "N°" in header_texts and "Joueur" in header_texts
-        runner.run_test(test_name, lambda: correct, True,
-                       f"Headers: {header_texts}")
-    except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+    header_texts = snap.get("headers", [])
+    correct = "N°" in header_texts and "Joueur" in header_texts
+    runner.run_test(test_name, correct, True,
+                   f"Headers: {header_texts}")
     
     # Test 7: Login button is visible when not logged in
     test_name = "Login button is visible for anonymous users"
-    try:
-        login_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Connexion')]")
-        visible = login_btn.is_displayed()
-        runner.run_test(test_name, lambda: visible, True,
-                       f"Button visible: {visible}")
-    except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Login button not found")
+    login_visible = snap.get("loginVisible")
+    if login_visible is not None:
+        runner.run_test(test_name, login_visible, True,
+                       f"Button visible: {login_visible}")
+    else:
+        runner.run_test(test_name, False, True, "Login button not found")
     
     # Test 8: Signup link is visible
     test_name = "Signup link is visible"
-    try:
-        signup_link = driver.find_element(By.XPATH, "//a[contains(text(), 'Créer un compte')]")
-        visible = signup_link.is_displayed()
-        runner.run_test(test_name, lambda: visible, True,
-                       f"Link visible: {visible}")
-    except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Signup link not found")
+    signup_visible = snap.get("signupVisible")
+    if signup_visible is not None:
+        runner.run_test(test_name, signup_visible, True,
+                       f"Link visible: {signup_visible}")
+    else:
+        runner.run_test(test_name, False, True, "Signup link not found")
     
     runner.print_summary()
     return runner
@@ -466,62 +833,70 @@ def test_page_load(driver):
 def test_login_modal(driver):
     """Test login modal functionality"""
     print_test_header("LOGIN MODAL TESTS")
-    runner = TestRunner("Login Modal")
+    runner = TestRunner("Login Modal", critical=True)
+    
+    # Precondition: the page may be reused from an earlier suite, so make sure no modal is open.
+    # Logging out through the app's session sync keeps Vue's modal state in sync with the DOM.
+    driver.execute_script(
+        "if (document.querySelector('.modal.show')) {"
+        " window.localStorage.removeItem('currentUser');"
+        " window.dispatchEvent(new Event('app:session')); }")
+    wait_until(driver, EC.invisibility_of_element_located(Locators.MODAL))
     
     # Test 1: Login modal opens on button click
     test_name = "Login modal opens when clicking login button"
     try:
-        login_btn = wait_for_clickable(driver, By.XPATH, "//button[contains(text(), 'Connexion')]")
+        login_btn = wait_for_clickable(driver, *Locators.LOGIN_BTN)
         login_btn.click()
-        time.sleep(0.5)
+        wait_until(driver, EC.visibility_of_element_located(Locators.MODAL))
         
         modal_visible = is_modal_visible(driver, "show")
-        runner.run_test(test_name, lambda: modal_visible, True,
+        runner.run_test(test_name, modal_visible, True,
                        f"Modal visible: {modal_visible}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     # Test 2: Modal has correct title
     test_name = "Login modal displays 'Connexion' title"
     try:
-        modal_title = driver.find_element(By.CSS_SELECTOR, ".modal.show h2")
+        modal_title = driver.find_element(*Locators.MODAL_TITLE)
         correct_title = modal_title.text == "Connexion"
-        runner.run_test(test_name, lambda: correct_title, True,
+        runner.run_test(test_name, correct_title, True,
                        f"Title: {modal_title.text}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Modal title not found")
+        runner.run_test(test_name, False, True, "Modal title not found")
     
     # Test 3: Username input field is present
     test_name = "Username input field is present"
     try:
-        username_input = driver.find_element(By.CSS_SELECTOR, ".modal.show input[type='text']")
-        runner.run_test(test_name, lambda: username_input is not None, True,
+        username_input = driver.find_element(*Locators.MODAL_USER)
+        runner.run_test(test_name, username_input is not None, True,
                        "Input found")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Username input not found")
+        runner.run_test(test_name, False, True, "Username input not found")
     
     # Test 4: PIN input field is present with maxlength=4
     test_name = "PIN input field has maxlength='4'"
     try:
-        pin_input = driver.find_element(By.CSS_SELECTOR, ".modal.show input[type='password']")
+        pin_input = driver.find_element(*Locators.MODAL_PIN)
         maxlength = pin_input.get_attribute("maxlength")
-        runner.run_test(test_name, lambda: maxlength == "4", True,
+        runner.run_test(test_name, maxlength == "4", True,
                        f"Maxlength: {maxlength}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "PIN input not found")
+        runner.run_test(test_name, False, True, "PIN input not found")
     
     # Test 5: Cancel button closes modal
     test_name = "Cancel button closes the login modal"
     try:
-        cancel_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Annuler')]")
+        cancel_btn = driver.find_element(*Locators.LOGIN_CANCEL)
         cancel_btn.click()
-        time.sleep(0.5)
+        wait_until(driver, EC.invisibility_of_element_located(Locators.MODAL))
         
         modal_closed = not is_modal_visible(driver, "show")
-        runner.run_test(test_name, lambda: modal_closed, True,
+        runner.run_test(test_name, modal_closed, True,
                        f"Modal closed: {modal_closed}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Cancel button not found")
+        runner.run_test(test_name, False, True, "Cancel button not found")
     
     runner.print_summary()
     return runner
@@ -529,7 +904,7 @@ def test_login_modal(driver):
 def test_user_login_flow(driver):
     """Test complete user login flow"""
     print_test_header("USER LOGIN FLOW TESTS")
-    runner = TestRunner("User Login Flow")
+    runner = TestRunner("User Login Flow", critical=True)
     
     # Test 1: Successful login with valid credentials
     test_name = "User can log in with valid credentials"
@@ -537,46 +912,46 @@ def test_user_login_flow(driver):
     
     # Check if user menu is visible
     try:
-        user_display = driver.find_element(By.XPATH, f"//strong[contains(text(), '{TEST_USER['username']}')]")
-        logged_in = user_display.is_displayed()
-        runner.run_test(test_name, lambda: logged_in, True,
+        user_display = driver.find_element(*Locators.CURRENT_USER)
+        logged_in = user_display.is_displayed() and TEST_USER['username'] in user_display.text
+        runner.run_test(test_name, logged_in, True,
                        f"Logged in as: {TEST_USER['username']}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "User display not found")
+        runner.run_test(test_name, False, True, "User display not found")
     
     # Test 2: Logout button is visible when logged in
     test_name = "Logout button is visible after login"
     try:
-        logout_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Déconnexion')]")
+        logout_btn = driver.find_element(*Locators.LOGOUT_BTN)
         visible = logout_btn.is_displayed()
-        runner.run_test(test_name, lambda: visible, True,
+        runner.run_test(test_name, visible, True,
                        f"Button visible: {visible}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Logout button not found")
+        runner.run_test(test_name, False, True, "Logout button not found")
     
     # Test 3: Registration section is visible when logged in
     test_name = "Registration section is visible for logged-in users"
     try:
         registration_section = driver.find_element(By.CSS_SELECTOR, ".registration-section")
         visible = registration_section.is_displayed()
-        runner.run_test(test_name, lambda: visible, True,
+        runner.run_test(test_name, visible, True,
                        f"Section visible: {visible}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Registration section not found")
+        runner.run_test(test_name, False, True, "Registration section not found")
     
     # Test 4: User can logout
     test_name = "User can logout successfully"
     logout_success = logout_user(driver)
-    time.sleep(0.5)
+    wait_until(driver, EC.visibility_of_element_located(Locators.LOGIN_BTN))
     
     # Check if login button is back
     try:
-        login_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Connexion')]")
+        login_btn = driver.find_element(*Locators.LOGIN_BTN)
         logged_out = login_btn.is_displayed()
-        runner.run_test(test_name, lambda: logged_out, True,
+        runner.run_test(test_name, logged_out, True,
                        f"Logged out: {logged_out}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Login button not found")
+        runner.run_test(test_name, False, True, "Login button not found")
     
     runner.print_summary()
     return runner
@@ -586,67 +961,67 @@ def test_player_registration(driver):
     print_test_header("PLAYER REGISTRATION TESTS")
     runner = TestRunner("Player Registration")
     
+    user = TEST_USER["username"]
+    USER_ROW = (By.CSS_SELECTOR, f"tr[data-username='{user}']")
+    
     # Login first
-    login_user(driver, TEST_USER["username"], TEST_USER["pin"])
-    time.sleep(1)
+    restore_session(driver, TEST_USER["username"], TEST_USER["pin"])
+    wait_until(driver, EC.visibility_of_element_located(Locators.LOGOUT_BTN))
     
     # Test 1: Registration button is present
     test_name = "Registration button is visible to logged-in user"
     try:
-        register_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'inscrire')]")
+        register_btn = driver.find_element(*Locators.REGISTER_BTN)
         visible = register_btn.is_displayed()
-        runner.run_test(test_name, lambda: visible, True,
+        runner.run_test(test_name, visible, True,
                        f"Button visible: {visible}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Register button not found")
+        runner.run_test(test_name, False, True, "Register button not found")
     
     # Test 2: User can register for slot
     test_name = "User can register themselves for the slot"
     try:
         # First unregister if already registered
-        try:
-            unregister_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'désinscrire')]")
+        for unregister_btn in driver.find_elements(*Locators.UNREGISTER_BTN):
             if unregister_btn.is_displayed():
                 unregister_btn.click()
-                time.sleep(1)
-        except NoSuchElementException:
-            pass
+                wait_until(driver, EC.visibility_of_element_located(Locators.REGISTER_BTN))
         
         # Now register
-        register_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'inscrire')]")
+        register_btn = driver.find_element(*Locators.REGISTER_BTN)
         register_btn.click()
-        time.sleep(1.5)
+        wait_until(driver, EC.presence_of_element_located(USER_ROW))
         
         # Check if user appears in table
-        user_in_table = len(driver.find_elements(By.XPATH, f"//td[contains(text(), '{TEST_USER['username']}')]")) > 0
-        runner.run_test(test_name, lambda: user_in_table, True,
+        user_in_table = has(driver, USER_ROW)
+        runner.run_test(test_name, user_in_table, True,
                        f"User in table: {user_in_table}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     # Test 3: Unregister button appears after registration
     test_name = "Unregister button appears after successful registration"
     try:
-        unregister_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'désinscrire')]")
+        unregister_btn = driver.find_element(*Locators.UNREGISTER_BTN)
         visible = unregister_btn.is_displayed()
-        runner.run_test(test_name, lambda: visible, True,
+        runner.run_test(test_name, visible, True,
                        f"Button visible: {visible}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Unregister button not found")
+        runner.run_test(test_name, False, True, "Unregister button not found")
     
     # Test 4: User can unregister
     test_name = "User can unregister from the slot"
     try:
-        unregister_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'désinscrire')]")
+        unregister_btn = driver.find_element(*Locators.UNREGISTER_BTN)
         unregister_btn.click()
-        time.sleep(1.5)
+        wait_until(driver, EC.invisibility_of_element_located(USER_ROW))
         
         # Check if user is removed from table
-        user_not_in_table = len(driver.find_elements(By.XPATH, f"//td[contains(text(), '{TEST_USER['username']}')]")) == 0
-        runner.run_test(test_name, lambda: user_not_in_table, True,
+        user_not_in_table = not has(driver, USER_ROW)
+        runner.run_test(test_name, user_not_in_table, True,
                        f"User removed: {user_not_in_table}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     logout_user(driver)
     runner.print_summary()
@@ -658,72 +1033,72 @@ def test_guest_registration(driver):
     runner = TestRunner("Guest Registration")
     
     # Login
-    login_user(driver, TEST_USER["username"], TEST_USER["pin"])
-    time.sleep(1)
+    restore_session(driver, TEST_USER["username"], TEST_USER["pin"])
+    wait_until(driver, EC.visibility_of_element_located(Locators.LOGOUT_BTN))
     
     # Test 1: Guest section is visible
     test_name = "Guest registration section is visible"
     try:
-        guest_section = driver.find_element(By.CSS_SELECTOR, ".guest-section")
+        guest_section = driver.find_element(*Locators.GUEST_SECTION)
         visible = guest_section.is_displayed()
-        runner.run_test(test_name, lambda: visible, True,
+        runner.run_test(test_name, visible, True,
                        f"Section visible: {visible}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Guest section not found")
+        runner.run_test(test_name, False, True, "Guest section not found")
     
     # Test 2: Guest name input field is present
     test_name = "Guest name input field is present"
     try:
-        guest_input = driver.find_element(By.CSS_SELECTOR, ".guest-section input[type='text']")
-        runner.run_test(test_name, lambda: guest_input is not None, True,
+        guest_input = driver.find_element(*Locators.GUEST_INPUT)
+        runner.run_test(test_name, guest_input is not None, True,
                        "Input found")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Guest input not found")
+        runner.run_test(test_name, False, True, "Guest input not found")
     
     # Test 3: User can register a guest
     test_name = "User can register a guest player"
     guest_name = f"GuestUI_{random.randint(1000, 9999)}"
+    GUEST_ROW = (By.CSS_SELECTOR, f"tr[data-username*='{guest_name}']")
+    GUEST_DELETE_BTN = (By.CSS_SELECTOR, f"tr[data-username*='{guest_name}'] .delete-btn")
     try:
-        guest_input = driver.find_element(By.CSS_SELECTOR, ".guest-section input[type='text']")
-        guest_input.clear()
-        guest_input.send_keys(guest_name)
+        guest_input = driver.find_element(*Locators.GUEST_INPUT)
+        set_input(driver, guest_input, guest_name)
         
-        guest_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Enregistrer un invité')]")
+        guest_btn = driver.find_element(*Locators.GUEST_SUBMIT)
         guest_btn.click()
-        time.sleep(1.5)
+        wait_until(driver, EC.presence_of_element_located(GUEST_ROW))
         
         # Check if guest appears in table
-        guest_in_table = len(driver.find_elements(By.XPATH, f"//td[contains(text(), '{guest_name}')]")) > 0
-        runner.run_test(test_name, lambda: guest_in_table, True,
+        guest_in_table = has(driver, GUEST_ROW)
+        runner.run_test(test_name, guest_in_table, True,
                        f"Guest in table: {guest_name}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     # Test 4: Guest input clears after registration
     test_name = "Guest input field clears after successful registration"
     try:
-        guest_input = driver.find_element(By.CSS_SELECTOR, ".guest-section input[type='text']")
+        guest_input = driver.find_element(*Locators.GUEST_INPUT)
         is_empty = guest_input.get_attribute("value") == ""
-        runner.run_test(test_name, lambda: is_empty, True,
+        runner.run_test(test_name, is_empty, True,
                        f"Input empty: {is_empty}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Guest input not found")
+        runner.run_test(test_name, False, True, "Guest input not found")
     
     # Test 5: User can delete their own guest
     test_name = "User can delete their own guest"
     try:
         # Find delete button for the guest we just added
-        delete_btn = driver.find_element(By.XPATH, 
-            f"//tr[.//td[contains(text(), '{guest_name}')]]//button[contains(@class, 'delete-btn')]")
+        delete_btn = driver.find_element(*GUEST_DELETE_BTN)
         delete_btn.click()
-        time.sleep(1.5)
+        wait_until(driver, EC.invisibility_of_element_located(GUEST_ROW))
         
         # Check if guest is removed
-        guest_removed = len(driver.find_elements(By.XPATH, f"//td[contains(text(), '{guest_name}')]")) == 0
-        runner.run_test(test_name, lambda: guest_removed, True,
+        guest_removed = not has(driver, GUEST_ROW)
+        runner.run_test(test_name, guest_removed, True,
                        f"Guest removed: {guest_removed}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     logout_user(driver)
     runner.print_summary()
@@ -734,69 +1109,68 @@ def test_admin_features(driver):
     print_test_header("ADMIN FEATURES TESTS")
     runner = TestRunner("Admin Features")
     
+    user = TEST_USER["username"]
+    USER_ROW = (By.CSS_SELECTOR, f"tr[data-username='{user}']")
+    USER_DELETE_BTN = (By.CSS_SELECTOR, f"tr[data-username='{user}'] .delete-btn")
+    
     # First, have a normal user register
-    login_user(driver, TEST_USER["username"], TEST_USER["pin"])
-    time.sleep(1)
+    restore_session(driver, TEST_USER["username"], TEST_USER["pin"])
+    wait_until(driver, EC.visibility_of_element_located(Locators.LOGOUT_BTN))
     
     try:
         # Unregister if already registered
-        try:
-            unregister_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'désinscrire')]")
+        for unregister_btn in driver.find_elements(*Locators.UNREGISTER_BTN):
             if unregister_btn.is_displayed():
                 unregister_btn.click()
-                time.sleep(1)
-        except:
-            pass
+                wait_until(driver, EC.visibility_of_element_located(Locators.REGISTER_BTN))
         
         # Register user
-        register_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'inscrire')]")
+        register_btn = driver.find_element(*Locators.REGISTER_BTN)
         register_btn.click()
-        time.sleep(1.5)
+        wait_until(driver, EC.presence_of_element_located(USER_ROW))
     except:
         pass
     
     logout_user(driver)
-    time.sleep(1)
     
     # Login as admin
-    login_user(driver, ADMIN_USER["username"], ADMIN_USER["pin"])
-    time.sleep(1)
+    restore_session(driver, ADMIN_USER["username"], ADMIN_USER["pin"])
+    wait_until(driver, EC.visibility_of_element_located(Locators.LOGOUT_BTN))
     
     # Test 1: Admin link is visible
     test_name = "Admin panel link is visible for admin users"
     try:
         admin_link = driver.find_element(By.CSS_SELECTOR, "a.admin-link")
         visible = admin_link.is_displayed()
-        runner.run_test(test_name, lambda: visible, True,
+        runner.run_test(test_name, visible, True,
                        f"Link visible: {visible}")
     except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Admin link not found")
+        runner.run_test(test_name, False, True, "Admin link not found")
     
     # Test 2: Admin can see delete buttons for all players
     test_name = "Admin can see delete buttons for all players"
     try:
-        delete_buttons = driver.find_elements(By.CSS_SELECTOR, ".delete-btn")
-        has_buttons = len(delete_buttons) > 0
-        runner.run_test(test_name, lambda: has_buttons, True,
-                       f"Delete buttons found: {len(delete_buttons)}")
+        delete_count = count(driver, (By.CSS_SELECTOR, ".delete-btn"))
+        has_buttons = delete_count > 0
+        runner.run_test(test_name, has_buttons, True,
+                       f"Delete buttons found: {delete_count}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     # Test 3: Admin can delete other users
     test_name = "Admin can remove other users from slot"
     try:
         # Find testuser in table
-        user_row = driver.find_element(By.XPATH, f"//tr[.//td[contains(text(), '{TEST_USER['username']}')]]")
-        delete_btn = user_row.find_element(By.CSS_SELECTOR, ".delete-btn")
+        delete_btn = driver.find_element(*USER_DELETE_BTN)
         delete_btn.click()
-        time.sleep(1.5)
+        wait_until(driver, EC.invisibility_of_element_located(USER_ROW))
         
         # Check if user is removed
-        user_removed = len(driver.find_elements(By.XPATH, f"//td[contains(text(), '{TEST_USER['username']}')]")) == 0
-        runner.run_test(test_name, lambda: user_removed, True,
+        user_removed = not has(driver, USER_ROW)
+        runner.run_test(test_name, user_removed, True,
                        f"User removed by admin: {user_removed}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     logout_user(driver)
     runner.print_summary()
@@ -807,50 +1181,46 @@ def test_data_display(driver):
     print_test_header("DATA DISPLAY TESTS")
     runner = TestRunner("Data Display")
     
-    driver.get(BASE_URL)
-    time.sleep(1)
+    # The page was loaded (or reset) by the suite's preparation step; once the app
+    # has rendered, the row count and row numbers come from one snapshot payload
+    try:
+        wait_for_app_ready(driver)
+        snap = page_snapshot(driver)
+    except Exception as e:
+        snap = {"error": str(e)}
     
     # Test 1: Player count is displayed
     test_name = "Player count is displayed correctly"
-    try:
-        count_display = driver.find_element(By.XPATH, "//p[contains(., 'Joueurs inscrits')]")
-        has_count = count_display.text != ""
-        runner.run_test(test_name, lambda: has_count, True,
-                       f"Count display: {count_display.text[:50]}")
-    except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Count display not found")
+    count_text = snap.get("countText")
+    if count_text is not None:
+        runner.run_test(test_name, count_text != "", True,
+                       f"Count display: {count_text[:50]}")
+    else:
+        runner.run_test(test_name, False, True, snap.get("error", "Count display not found"))
+    
+    row_count, number_texts = snap.get("rowCount", 0), snap.get("rowNums", [])
     
     # Test 2: Table has 10 rows (for 10 players)
     test_name = "Table has exactly 10 rows for players"
-    try:
-        rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
-        runner.run_test(test_name, lambda: len(rows) == 10, True,
-                       f"Rows: {len(rows)}")
-    except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+    runner.run_test(test_name, row_count == 10, True,
+                   f"Rows: {row_count}")
     
     # Test 3: Row numbers are sequential (1-10)
     test_name = "Row numbers are sequential from 1 to 10"
-    try:
-        numbers = driver.find_elements(By.CSS_SELECTOR, "tbody td:first-child")
-        number_texts = [n.text for n in numbers]
-        sequential = number_texts == [str(i) for i in range(1, 11)]
-        runner.run_test(test_name, lambda: sequential, True,
-                       f"Numbers: {number_texts}")
-    except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+    sequential = number_texts == [str(i) for i in range(1, 11)]
+    runner.run_test(test_name, sequential, True,
+                   f"Numbers: {number_texts}")
     
     # Test 4: Date format is displayed correctly
     test_name = "Slot date is formatted correctly"
-    try:
-        date_elem = driver.find_element(By.XPATH, "//p[contains(@class, 'date')]")
-        date_text = date_elem.text
+    date_text = snap.get("date")
+    if date_text is not None:
         # Should contain "mercredi" (Wednesday) and time "19h00"
         has_day = "mercredi" in date_text.lower()
-        runner.run_test(test_name, lambda: has_day, True,
+        runner.run_test(test_name, has_day, True,
                        f"Date: {date_text[:50]}")
-    except NoSuchElementException:
-        runner.run_test(test_name, lambda: False, True, "Date element not found")
+    else:
+        runner.run_test(test_name, False, True, "Date element not found")
     
     runner.print_summary()
     return runner
@@ -860,60 +1230,51 @@ def test_responsive_updates(driver):
     print_test_header("RESPONSIVE UPDATE TESTS")
     runner = TestRunner("Responsive Updates")
     
+    user = TEST_USER2["username"]
+    USER_ROW = (By.CSS_SELECTOR, f"tr[data-username='{user}']")
+    
     # Login
-    login_user(driver, TEST_USER2["username"], TEST_USER2["pin"])
-    time.sleep(1)
+    restore_session(driver, TEST_USER2["username"], TEST_USER2["pin"])
+    wait_until(driver, EC.visibility_of_element_located(Locators.LOGOUT_BTN))
     
     # Test 1: Player count updates after registration
     test_name = "Player count updates after user registration"
     try:
-        # Get initial count
-        count_elem = driver.find_element(By.XPATH, "//p[contains(., 'Joueurs inscrits')]")
-        initial_text = count_elem.text
-        
         # Unregister if needed
-        try:
-            unregister_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'désinscrire')]")
-            unregister_btn.click()
-            time.sleep(1.5)
-        except:
-            pass
-        
-        # Register
-        register_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'inscrire')]")
-        register_btn.click()
-        time.sleep(1.5)
+        for unregister_btn in driver.find_elements(*Locators.UNREGISTER_BTN):
+            if unregister_btn.is_displayed():
+                unregister_btn.click()
+                wait_until(driver, EC.visibility_of_element_located(Locators.REGISTER_BTN))
         
-        # Get new count
-        count_elem = driver.find_element(By.XPATH, "//p[contains(., 'Joueurs inscrits')]")
-        new_text = count_elem.text
+        # Get initial count
+        initial_text = text_of(driver, Locators.PLAYER_COUNT)
         
-        # Text should be different
-        updated = new_text != initial_text
-        runner.run_test(test_name, lambda: updated, True,
+        # Register, then poll the count text in-page until it changes
+        register_btn = driver.find_element(*Locators.REGISTER_BTN)
+        register_btn.click()
+        updated = bool(wait_until(driver, lambda d: text_of(d, Locators.PLAYER_COUNT) != initial_text))
+        runner.run_test(test_name, updated, True,
                        f"Count changed: {updated}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     # Test 2: Table updates after registration
     test_name = "Table shows newly registered user immediately"
     try:
-        user_in_table = len(driver.find_elements(By.XPATH, 
-            f"//td[contains(text(), '{TEST_USER2['username']}')]")) > 0
-        runner.run_test(test_name, lambda: user_in_table, True,
+        user_in_table = has(driver, USER_ROW)
+        runner.run_test(test_name, user_in_table, True,
                        f"User visible: {user_in_table}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     # Test 3: Button changes after registration
     test_name = "Register button changes to unregister button"
     try:
-        unregister_btn_exists = len(driver.find_elements(By.XPATH, 
-            "//button[contains(text(), 'désinscrire')]")) > 0
-        runner.run_test(test_name, lambda: unregister_btn_exists, True,
+        unregister_btn_exists = has(driver, Locators.UNREGISTER_BTN)
+        runner.run_test(test_name, unregister_btn_exists, True,
                        f"Unregister button visible: {unregister_btn_exists}")
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     logout_user(driver)
     runner.print_summary()
@@ -928,180 +1289,210 @@ def test_error_handling(driver):
     test_name = "Invalid login credentials show error message"
     try:
         # Open login modal
-        login_btn = wait_for_clickable(driver, By.XPATH, "//button[contains(text(), 'Connexion')]")
+        login_btn = wait_for_clickable(driver, *Locators.LOGIN_BTN)
         login_btn.click()
-        time.sleep(0.5)
+        wait_until(driver, EC.visibility_of_element_located(Locators.MODAL))
         
         # Fill with invalid credentials
-        username_input = driver.find_element(By.CSS_SELECTOR, ".modal.show input[type='text']")
-        pin_input = driver.find_element(By.CSS_SELECTOR, ".modal.show input[type='password']")
+        username_input = driver.find_element(*Locators.MODAL_USER)
+        pin_input = driver.find_element(*Locators.MODAL_PIN)
         
-        username_input.clear()
-        username_input.send_keys("invaliduser")
-        pin_input.clear()
-        pin_input.send_keys("9999")
+        set_input(driver, username_input, "invaliduser")
+        set_input(driver, pin_input, "9999")
         
         # Submit
-        submit_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Se connecter')]")
+        submit_btn = driver.find_element(*Locators.LOGIN_SUBMIT)
         submit_btn.click()
-        time.sleep(1)
+        wait_until(driver, EC.visibility_of_element_located(Locators.MODAL_ERROR))
         
         # Check for error message
-        error_elem = driver.find_element(By.CSS_SELECTOR, ".modal.show .error")
+        error_elem = driver.find_element(*Locators.MODAL_ERROR)
         error_visible = error_elem.is_displayed()
-        runner.run_test(test_name, lambda: error_visible, True,
+        runner.run_test(test_name, error_visible, True,
                        f"Error shown: {error_elem.text[:50] if error_visible else 'N/A'}")
         
         # Close modal
-        cancel_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Annuler')]")
+        cancel_btn = driver.find_element(*Locators.LOGIN_CANCEL)
         cancel_btn.click()
-        time.sleep(0.5)
+        wait_until(driver, EC.invisibility_of_element_located(Locators.MODAL))
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     # Test 2: Empty guest name shows error
     test_name = "Empty guest name shows appropriate error"
     try:
         # Login
-        login_user(driver, TEST_USER["username"], TEST_USER["pin"])
-        time.sleep(1)
+        restore_session(driver, TEST_USER["username"], TEST_USER["pin"])
+        wait_until(driver, EC.visibility_of_element_located(Locators.LOGOUT_BTN))
         
         # Try to register guest with empty name
-        guest_btn = driver.find_element(By.XPATH, "//button[contains(text(), 'Enregistrer un invité')]")
+        guest_btn = driver.find_element(*Locators.GUEST_SUBMIT)
         guest_btn.click()
-        time.sleep(1)
+        wait_until(driver, EC.presence_of_element_located(Locators.ERROR))
         
         # Check for error (could be inline or toast)
         # The API should reject this and Vue should display the error
-        has_error = len(driver.find_elements(By.CSS_SELECTOR, ".error")) > 0
-        runner.run_test(test_name, lambda: has_error, True,
+        has_error = has(driver, Locators.ERROR)
+        runner.run_test(test_name, has_error, True,
                        f"Error displayed: {has_error}")
         
         logout_user(driver)
     except Exception as e:
-        runner.run_test(test_name, lambda: False, True, f"Error: {e}")
+        runner.run_test(test_name, False, True, f"Error: {e}")
     
     runner.print_summary()
     return runner
 
+# Suites that never change the slot, safe to run concurrently on the browser pool
+PARALLEL_SUITES = [
+    test_page_load,
+    test_login_modal,
+    test_data_display,
+    test_error_handling,
+]
+
+# Suites that register/unregister players share one driver and run in order:
+# (phase banner or None, state reset to run first, suite)
+SERIAL_SUITES = [
+    ("PHASE 2: AUTHENTICATION UI", _reset_page, test_user_login_flow),
+    ("PHASE 3: USER ACTIONS", _between_suites, test_player_registration),
+    (None, _between_suites, test_guest_registration),
+    ("PHASE 4: ADMIN FUNCTIONALITY", _between_suites, test_admin_features),
+    ("PHASE 5: LIVE UPDATES", _reset_page, test_responsive_updates),
+]
+
 # =============================================================================
 # MAIN TEST RUNNER
 # =============================================================================
 
 def main():
     """Run all UI tests"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'SOCCER SLOT MANAGER - UI TESTS':^70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}")
-    print(f"{Colors.CYAN}Test Target: {BASE_URL}{Colors.RESET}")
-    print(f"{Colors.CYAN}Test Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*70}{Colors.RESET}\n")
+    # Local aliases: main() is print-heavy, so avoid repeated Colors attribute lookups
+    B, BL, R, G, Y, RD, C = Colors.BOLD, Colors.BLUE, Colors.RESET, Colors.GREEN, Colors.YELLOW, Colors.RED, Colors.CYAN
+    _TS = time.strftime('%Y-%m-%d %H:%M:%S')
+    
+    # Persist Selenium Manager's downloaded drivers across runs
+    os.environ.setdefault("SE_CACHE_PATH", os.path.expanduser("~/.cache/selenium"))
+    
+    # --fresh: start from empty browser profiles (drops cached assets)
+    if "--fresh" in sys.argv[1:]:
+        shutil.rmtree(PROFILE_ROOT, ignore_errors=True)
+    
+    print(f"\n{_HDR}")
+    print(f"{B}{BL}{'SOCCER SLOT MANAGER - UI TESTS':^70}{R}")
+    print(_HDR)
+    print(f"{C}Test Target: {BASE_URL}{R}")
+    print(f"{C}Test Time: {_TS}{R}")
+    print(f"{_HDR}\n")
+    
+    # Start the shared WebDriver speculatively; its launch overlaps the browser
+    # probe below and the parallel phase, and is only awaited before phase 2
+    launcher = ThreadPoolExecutor(max_workers=1)
+    driver_future = launcher.submit(get_shared_driver, True)
+    launcher.shutdown(wait=False)
     
     # Check browser availability
-    print(f"{Colors.YELLOW}🔍 Checking for available browsers...{Colors.RESET}")
+    print(f"{Y}🔍 Checking for available browsers...{R}")
     available = check_browser_availability()
     found_browsers = [k for k, v in available.items() if v]
     
     if not found_browsers:
-        print(f"\n{Colors.RED}❌ No supported browser found!{Colors.RESET}")
-        print(f"\n{Colors.YELLOW}Please install a browser:{Colors.RESET}")
+        # Discard the speculative launch (it most likely failed anyway)
+        try:
+            driver_future.result()
+        except Exception:
+            pass
+        quit_shared_driver()
+        print(f"\n{RD}❌ No supported browser found!{R}")
+        print(f"\n{Y}Please install a browser:{R}")
         print(f"  Ubuntu/Debian: sudo apt-get install chromium-browser")
         print(f"              or sudo apt-get install firefox")
         print(f"  Fedora/RHEL:   sudo dnf install chromium")
         print(f"  macOS:         brew install --cask chromium")
         return 1
     
-    print(f"{Colors.GREEN}✓ Found browsers: {', '.join(found_browsers)}{Colors.RESET}\n")
+    print(f"{G}✓ Found browsers: {', '.join(found_browsers)}{R}\n")
     
     driver = None
-    runners = []
+    # One slot per suite, indexed by position in PARALLEL_SUITES + SERIAL_SUITES
+    parallel_count = len(PARALLEL_SUITES)
+    runners = [None] * (parallel_count + len(SERIAL_SUITES))
     
     try:
-        # Create WebDriver
-        print(f"{Colors.YELLOW}🚀 Initializing WebDriver...{Colors.RESET}\n")
-        driver = create_driver(headless=True)
-        
-        # Run test suites
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 1: PAGE LOAD & STRUCTURE ═══{Colors.RESET}")
-        runners.append(test_page_load(driver))
-        
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 2: AUTHENTICATION UI ═══{Colors.RESET}")
-        # Reload page for clean state
-        driver.get(BASE_URL)
-        time.sleep(1)
-        runners.append(test_login_modal(driver))
-        
-        driver.get(BASE_URL)
-        time.sleep(1)
-        runners.append(test_user_login_flow(driver))
-        
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 3: USER ACTIONS ═══{Colors.RESET}")
-        driver.get(BASE_URL)
-        time.sleep(1)
-        runners.append(test_player_registration(driver))
-        
-        driver.get(BASE_URL)
-        time.sleep(1)
-        runners.append(test_guest_registration(driver))
+        # Read-only suites: pooled browsers, run concurrently
+        print(f"\n{B}{BL}═══ PHASE 1: PAGE LOAD, DISPLAY & ERROR HANDLING (PARALLEL) ═══{R}")
+        runners[:parallel_count] = run_suites_parallel_pooled(PARALLEL_SUITES)
         
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 4: ADMIN FUNCTIONALITY ═══{Colors.RESET}")
-        driver.get(BASE_URL)
-        time.sleep(1)
-        runners.append(test_admin_features(driver))
-        
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 5: DATA DISPLAY & UPDATES ═══{Colors.RESET}")
-        driver.get(BASE_URL)
-        time.sleep(1)
-        runners.append(test_data_display(driver))
-        
-        driver.get(BASE_URL)
-        time.sleep(1)
-        runners.append(test_responsive_updates(driver))
+        serial_suites = SERIAL_SUITES
+        failed_critical = [r.suite_name for r in runners if r and r.critical and r.failed]
+        if failed_critical:
+            print(f"\n{RD}Critical suite failed ({', '.join(failed_critical)}); skipping remaining suites{R}")
+            serial_suites = []
+        else:
+            print(f"\n{Y}🚀 Initializing WebDriver...{R}\n")
+            driver = driver_future.result()
         
-        print(f"\n{Colors.BOLD}{Colors.BLUE}═══ PHASE 6: ERROR HANDLING ═══{Colors.RESET}")
-        driver.get(BASE_URL)
-        time.sleep(1)
-        runners.append(test_error_handling(driver))
+        for index, (phase, prepare, suite) in enumerate(serial_suites, start=parallel_count):
+            if phase:
+                print(f"\n{B}{BL}═══ {phase} ═══{R}")
+            prepare(driver)
+            runner = runners[index] = suite(driver)
+            if runner.critical and runner.failed:
+                print(f"\n{RD}Critical suite failed ({runner.suite_name}); skipping remaining suites{R}")
+                break
         
     except Exception as e:
-        print(f"\n{Colors.RED}Fatal error during test execution: {e}{Colors.RESET}")
+        print(f"\n{RD}Fatal error during test execution: {e}{R}")
     
     finally:
         if driver:
-            driver.quit()
-            print(f"\n{Colors.YELLOW}🛑 WebDriver closed{Colors.RESET}\n")
-    
-    # Print final summary
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'═'*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'FINAL TEST SUMMARY':^70}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'═'*70}{Colors.RESET}\n")
-    
-    total_passed = sum(r.passed for r in runners)
-    total_failed = sum(r.failed for r in runners)
-    total_tests = total_passed + total_failed
+            # Quit in the background so the summary prints right away; joined at exit
+            quitter = threading.Thread(target=quit_shared_driver, daemon=False)
+            quitter.start()
+            atexit.register(quitter.join, 5)
+            print(f"\n{Y}🛑 Closing WebDriver in the background{R}\n")
+    
+    # Suites skipped by a critical failure or a fatal error leave their slot empty
+    runners = [r for r in runners if r is not None]
+    
+    # Print final summary, assembled into one buffered write
+    buf = [
+        f"\n{_HDR2}",
+        f"{B}{BL}{'FINAL TEST SUMMARY':^70}{R}",
+        f"{_HDR2}\n",
+    ]
     
+    # Single pass: accumulate totals and build the per-suite lines together
+    total_passed = total_failed = 0
     for runner in runners:
+        total_passed += runner.passed
+        total_failed += runner.failed
         suite_total = runner.passed + runner.failed
-        suite_rate = (runner.passed / suite_total * 100) if suite_total > 0 else 0
-        status_color = Colors.GREEN if runner.failed == 0 else Colors.YELLOW if suite_rate >= 70 else Colors.RED
-        print(f"{status_color}▸ {runner.suite_name}: {runner.passed}/{suite_total} passed ({suite_rate:.0f}%){Colors.RESET}")
+        suite_rate = runner.passed * 100 // suite_total if suite_total else 0
+        status_color = G if runner.failed == 0 else Y if suite_rate >= 70 else RD
+        buf.append(f"{status_color}▸ {runner.suite_name}: {runner.passed}/{suite_total} passed ({suite_rate}%){R}")
+    total_tests = total_passed + total_failed
     
-    print(f"\n{Colors.BOLD}{'─'*70}{Colors.RESET}")
-    print(f"{Colors.BOLD}Overall Results:{Colors.RESET}")
-    print(f"  Total Tests:  {total_tests}")
-    print(f"  {Colors.GREEN}Passed: {total_passed}{Colors.RESET}")
-    print(f"  {Colors.RED}Failed: {total_failed}{Colors.RESET}")
+    buf += [
+        f"\n{_RULE}",
+        f"{B}Overall Results:{R}",
+        f"  Total Tests:  {total_tests}",
+        f"  {G}Passed: {total_passed}{R}",
+        f"  {RD}Failed: {total_failed}{R}",
+    ]
     
     if total_tests > 0:
         overall_rate = (total_passed / total_tests * 100)
-        print(f"  Success Rate: {overall_rate:.1f}%")
+        buf.append(f"  Success Rate: {overall_rate:.1f}%")
         
         if total_failed == 0:
-            print(f"\n{Colors.GREEN}{Colors.BOLD}✓ ALL UI TESTS PASSED! 🎉{Colors.RESET}")
+            buf.append(f"\n{G}{B}✓ ALL UI TESTS PASSED! 🎉{R}")
         else:
-            print(f"\n{Colors.YELLOW}⚠ Some tests failed. Review the output above for details.{Colors.RESET}")
+            buf.append(f"\n{Y}⚠ Some tests failed. Review the output above for details.{R}")
     
-    print(f"{Colors.BOLD}{'─'*70}{Colors.RESET}\n")
+    buf.append(f"{_RULE}\n")
+    sys.stdout.write("\n".join(buf) + "\n")
+    sys.stdout.flush()
     
     return 0 if total_failed == 0 else 1
 